@@ -1,9 +1,26 @@
-from daily_tracker.core import report
-from daily_tracker.main import debug
-from daily_tracker.main import main as run
+from typing import Any
 
 __all__ = [
     "debug",
     "report",
     "run",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The commands pull in the integrations, Tk, and DuckDB, none of which
+    # are needed to parse the command line (e.g. for `--help`)
+    if name == "report":
+        from daily_tracker.core import report  # noqa: PLC0415
+
+        return report
+    if name == "debug":
+        from daily_tracker.main import debug  # noqa: PLC0415
+
+        return debug
+    if name == "run":
+        from daily_tracker.main import main as run  # noqa: PLC0415
+
+        return run
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
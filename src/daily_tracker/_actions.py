@@ -1,15 +1,53 @@
 # TODO: This needs to die. It's a legacy module that I haven't been able
 #       to refactor out yet
 
-import collections
+import concurrent.futures
 import datetime
+import functools
 import logging
 
+import cachetools
+
 from daily_tracker import core, integrations
 from daily_tracker.core import database, form
 
 logger = logging.getLogger("core")
 
+# A new ``ActionHandler`` is created for each pop-up, so the caches need to
+# live outside the instances to be shared between pop-ups. There's one cache
+# per interval so that the options last until the next pop-up
+_integration_options_caches: dict[int, cachetools.TTLCache] = {}
+
+# The non-database outputs are independent (mostly network) calls, so they
+# don't need to wait for each other
+_post_event_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=3,
+    thread_name_prefix="post-event",
+)
+
+
+def _integration_options_cache(
+    action_handler: "ActionHandler",
+) -> cachetools.TTLCache:
+    interval = action_handler.configuration.interval
+    if (cache := _integration_options_caches.get(interval)) is None:
+        # The extra minute is so that the next pop-up still finds the options
+        # even if it's a little later than the last one
+        cache = _integration_options_caches[interval] = cachetools.TTLCache(
+            maxsize=4,
+            ttl=(interval + 1) * 60,
+        )
+
+    return cache
+
+
+def _log_post_event_failure(
+    name: str,
+    future: concurrent.futures.Future,
+) -> None:
+    if (exception := future.exception()) is not None:
+        logger.error(f"Post-event action for '{name}' failed: {exception}")
+
 
 class ActionHandler:
     """
@@ -34,6 +72,32 @@ class ActionHandler:
         )
         self.form.generate_form()
 
+    @cachetools.cachedmethod(cache=_integration_options_cache)
+    def _get_integration_options(
+        self,
+        jira_filter: str | None = None,
+    ) -> tuple[tuple[core.Task, ...], tuple[str, ...], tuple[core.Task, ...]]:
+        """
+        Return the GitHub tasks, the Jira tickets, and the Monday subtasks for
+        the drop-down.
+
+        None of these depend on the entries that are posted, so they're
+        cached for the pop-up interval rather than cleared after each entry.
+        """
+
+        github_handler: integrations.GitHub = self.inputs.get("git_hub")  # type: ignore
+        jira_handler: integrations.Jira = self.inputs.get("jira")  # type: ignore
+        monday_handler: integrations.Monday = self.inputs.get("monday")  # type: ignore
+        now = datetime.datetime.now()
+
+        return (
+            tuple(github_handler.on_event(now)) if github_handler else (),
+            tuple(jira_handler.get_tickets_in_sprint())
+            if jira_handler and jira_filter
+            else (),
+            tuple(monday_handler.on_event(now)) if monday_handler else (),
+        )
+
     def get_dropdown_options(
         self,
         jira_filter: str | None = None,
@@ -43,38 +107,44 @@ class ActionHandler:
 
         This is always the most recent tasks, and optionally the tickets in the
         active sprint if a Jira connection has been configured.
+
+        The recent tasks are read from the database each time (which caches
+        them until an entry is written), while the other integrations' options
+        are cached for the pop-up interval.
         """
 
         database_handler: database.Database = self.outputs["database"]  # type: ignore
-        github_handler: integrations.GitHub = self.inputs.get("git_hub")  # type: ignore
-        jira_handler: integrations.Jira = self.inputs.get("jira")  # type: ignore
-        monday_handler: integrations.Monday = self.inputs.get("monday")  # type: ignore
+        github_tasks, jira_tickets, monday_subtasks = (
+            self._get_integration_options(jira_filter=jira_filter)
+        )
 
-        tasks_and_details = collections.defaultdict(list)
-        now = datetime.datetime.now()
+        # The inner dicts are ordered sets, so the details are deduplicated
+        # as they're added
+        tasks_and_details: dict[str, dict[str, None]] = {}
 
         for task, detail in database_handler.get_recent_tasks(
             self.configuration.show_last_n_weeks
         ).items():
-            tasks_and_details[task].append(detail)
+            tasks_and_details.setdefault(task, {})[detail] = None
 
-        if github_handler:
-            for task in github_handler.on_event(now):
-                tasks_and_details[task.task_name].append(task.details)
-
-        if jira_handler and jira_filter:
-            for ticket in jira_handler.get_tickets_in_sprint():
-                tasks_and_details[ticket].append("")
+        for task in github_tasks:
+            tasks_and_details.setdefault(task.task_name, {})[task.details] = (
+                None
+            )
 
-        if monday_handler:
-            for subtask in monday_handler.on_event(now):
-                tasks_and_details[subtask.task_name].extend(subtask.details)
+        # Tickets that are already recent tasks keep their recent details
+        # rather than picking up an extra blank one
+        for ticket in jira_tickets:
+            tasks_and_details.setdefault(ticket, {"": None})
 
-        # deduplicate the details
-        for task, details in tasks_and_details.items():
-            tasks_and_details[task] = list(dict.fromkeys(details))
+        for subtask in monday_subtasks:
+            tasks_and_details.setdefault(subtask.task_name, {}).update(
+                dict.fromkeys(subtask.details)
+            )
 
-        return tasks_and_details
+        return {
+            task: list(details) for task, details in tasks_and_details.items()
+        }
 
     def do_on_events(
         self,
@@ -113,20 +183,24 @@ class ActionHandler:
     def do_post_events(self) -> None:
         """
         The actions to perform after the "pop-up" event.
-        """
 
-        # Dirty approach to get the database stuff done first
-        outputs_ = [self.outputs["database"]] + [
-            handler
-            for name, handler in self.outputs.items()
-            if name != "database"
-        ]
+        The database is written to first, and then the other outputs are
+        run concurrently in the background so that the pop-up can close
+        straight away. A failure in one of the other outputs is logged
+        rather than stopping the rest.
+        """
 
-        for handler in outputs_:
-            entry = core.Entry(
-                date_time=self.form.at_datetime,
-                task_name=self.form.task,
-                detail=self.form.detail,
-                interval=self.form.interval,
-            )
-            handler.post_event(entry)
+        entry = core.Entry(
+            date_time=self.form.at_datetime,
+            task_name=self.form.task,
+            detail=self.form.detail,
+            interval=self.form.interval,
+        )
+        self.outputs["database"].post_event(entry)
+
+        for name, handler in self.outputs.items():
+            if name != "database":
+                future = _post_event_executor.submit(handler.post_event, entry)
+                future.add_done_callback(
+                    functools.partial(_log_post_event_failure, name)
+                )
@@ -1,3 +1,5 @@
+from typing import Any
+
 from daily_tracker.core.apis import (
     Entry,
     Input,
@@ -5,7 +7,6 @@ from daily_tracker.core.apis import (
     Task,
 )
 from daily_tracker.core.configuration import Configuration
-from daily_tracker.core.reports import report
 
 __all__ = [
     "Configuration",
@@ -15,3 +16,14 @@ __all__ = [
     "Task",
     "report",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The reports need DuckDB, which is slow to import and isn't needed to
+    # run the tracker itself
+    if name == "report":
+        from daily_tracker.core.reports import report  # noqa: PLC0415
+
+        return report
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -78,24 +78,44 @@ class API(abc.ABC):
     """
 
     apis: ClassVar[dict[str, API]]
+    _api_key: ClassVar[str]
+    _api_bases: ClassVar[tuple[type[API], ...]]
+
+    def __init_subclass__(
+        cls, api_key: str | None = None, **kwargs: Any
+    ) -> None:
+        """
+        Resolve the ``apis`` key and the ``API`` bases once per subclass,
+        rather than on every instantiation.
+
+        The key defaults to the snake-case class name, but can be set
+        explicitly with the ``api_key`` class keyword::
+
+            class Jira(Input, Output, api_key="jira"): ...
+        """
+
+        super().__init_subclass__(**kwargs)
+        cls._api_key = api_key or utils.pascal_to_snake(cls.__name__)
+        cls._api_bases = tuple(
+            base for base in cls.__bases__ if issubclass(base, API)
+        )
 
     @classmethod
     def __new__(cls, *args, **kwargs) -> API:  # noqa: ANN002, ANN003
         """
-        During the initialisation of the subclass, use some metaprogramming to
-        automatically bind the subclass to the ``Input`` and ``Output`` classes
-        ``apis`` property.
+        During the initialisation of the subclass, automatically bind the
+        instance to the ``Input`` and ``Output`` classes ``apis`` property.
         """
 
         instance = super().__new__(cls)
-        key = utils.pascal_to_snake(cls.__name__)
+        key = cls._api_key
 
-        for base in cls.__bases__:
-            if issubclass(base, API):
+        for base in cls._api_bases:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     f"Adding class {instance} to `{base}.apis` with key '{key}'"
                 )
-                base.apis[key] = instance
+            base.apis[key] = instance
 
         return instance
 
@@ -159,12 +179,12 @@ class Input(API, IInput, abc.ABC):
         there could be other interfaces.
         """
 
-        tasks = [
-            object_.on_event(date_time=date_time)
-            for name, object_ in cls.apis.items()
-        ]
-
-        return list(itertools.chain.from_iterable(tasks))
+        return list(
+            itertools.chain.from_iterable(
+                object_.on_event(date_time=date_time)
+                for object_ in cls.apis.values()
+            )
+        )
 
 
 class Output(API, IOutput, abc.ABC):
@@ -181,11 +201,11 @@ class Output(API, IOutput, abc.ABC):
         Execute the actions after the "pop-up" event.
         """
 
-        for object_ in Output.apis.values():
-            object_.post_event(entry=entry)
+        for object_ in cls.apis.values():
+            object_.post_event(entry)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 @functools.total_ordering
 class Task:
     """
@@ -193,6 +213,9 @@ class Task:
 
     This has corresponding details, a priority, and a flag to indicate
     whether it's a default task or not.
+
+    This isn't frozen: the details are a list, so a frozen task still
+    couldn't be hashed.
     """
 
     task_name: str
@@ -211,7 +234,7 @@ class Task:
         return NotImplemented
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class Entry:
     """
     An entry for the tracker.
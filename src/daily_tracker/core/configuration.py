@@ -11,7 +11,7 @@ TODO: Inherit types from the JSON schema validator file?
 
 from __future__ import annotations
 
-import collections
+import functools
 import pathlib
 from typing import Any
 
@@ -21,6 +21,22 @@ from daily_tracker import utils
 
 # TODO: Take the default values from the JSON schema validator file
 DEFAULT_CONFIG = utils.DAILY_TRACKER / "resources/configuration.yaml"
+# The C loader is much faster, but is only available when PyYAML was built
+# against libyaml
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_configuration(filepath: pathlib.Path, mtime_ns: int) -> Configuration:
+    """
+    Read a configuration YAML file into a Configuration object.
+
+    The modified time is only used as part of the cache key so that the file
+    is re-read when it changes.
+    """
+
+    with open(filepath) as f:
+        return Configuration(yaml.load(f, YAML_LOADER))  # noqa: S506
 
 
 class Configuration:
@@ -31,6 +47,9 @@ class Configuration:
     more dynamic. Or just leave as a simple dict?
 
     The docstrings should be taken from the ``description`` property.
+
+    The options don't change once they've been read, so each one is only
+    looked up once per instance.
     """
 
     def __init__(self, configuration: dict) -> None:
@@ -49,12 +68,13 @@ class Configuration:
         """
 
         with open(filepath) as f_custom, open(DEFAULT_CONFIG) as f_base:
-            config = yaml.load(f_custom.read(), yaml.Loader)  # noqa: S506
+            config = yaml.load(f_custom, YAML_LOADER)  # noqa: S506
 
-            config["tracker"]["options"] = collections.ChainMap(
-                config["tracker"]["options"],
-                yaml.load(f_base.read(), yaml.Loader)["tracker"]["options"],  # noqa: S506
-            )
+            # The custom options take precedence over the base ones
+            config["tracker"]["options"] = {
+                **yaml.load(f_base, YAML_LOADER)["tracker"]["options"],  # noqa: S506
+                **config["tracker"]["options"],
+            }
 
         return Configuration(config)
 
@@ -62,62 +82,78 @@ class Configuration:
     def from_default(cls) -> Configuration:
         """
         Read the ``configuration.yaml`` into a Configuration object.
+
+        The file is only parsed again if it has been modified since it was
+        last read, so the same object is returned otherwise.
+        """
+
+        return _read_configuration(
+            filepath=DEFAULT_CONFIG,
+            mtime_ns=DEFAULT_CONFIG.stat().st_mtime_ns,
+        )
+
+    @staticmethod
+    def invalidate() -> None:
+        """
+        Clear the cached configuration so that the next ``from_default`` call
+        reads the file again.
         """
 
-        with open(DEFAULT_CONFIG) as f:
-            return Configuration(yaml.load(f.read(), yaml.Loader))  # noqa: S506
+        _read_configuration.cache_clear()
 
     def _get_option_value(self, option: str, default: Any) -> Any:
         return self.options.get(option, default)
 
-    @property
+    @functools.cached_property
     def interval(self) -> int:
         return self._get_option_value("interval", False)
 
-    @property
+    @functools.cached_property
     def keep_awake(self) -> bool:
         return self._get_option_value("keep-awake", False)
 
-    @property
+    @functools.cached_property
     def run_on_startup(self) -> bool:
         return self._get_option_value("run-on-startup", False)
 
-    @property
+    @functools.cached_property
     def show_last_n_weeks(self) -> int:
         return self._get_option_value("show-last-n-weeks", 2)
 
-    @property
-    def appointment_category_exclusions(self) -> list[str]:
-        return self._get_option_value("appointment-category-exclusions", [])
+    @functools.cached_property
+    def appointment_category_exclusions(self) -> frozenset[str]:
+        return frozenset(
+            self._get_option_value("appointment-category-exclusions", ())
+        )
 
-    @property
+    @functools.cached_property
     def linked_calendar(self) -> str:
         return self._get_option_value("linked-calendar", None)
 
-    @property
+    @functools.cached_property
     def github_issues_search(self) -> str:
         return self._get_option_value("github-issues-search", None)
 
-    @property
+    @functools.cached_property
     def jira_filter(self) -> str:
         return self._get_option_value("jira-filter", None)
 
-    @property
+    @functools.cached_property
     def post_to_slack(self) -> bool:
         return self._get_option_value("post-to-slack", False)
 
-    @property
+    @functools.cached_property
     def post_to_jira(self) -> bool:
         return self._get_option_value("post-to-jira", False)
 
-    @property
+    @functools.cached_property
     def save_csv_copy(self) -> bool:
         return self._get_option_value("save-csv-copy", False)
 
-    @property
+    @functools.cached_property
     def csv_filepath(self) -> str:
         return self._get_option_value("csv-filepath", str(pathlib.Path.home()))
 
-    @property
+    @functools.cached_property
     def monday_filter(self) -> str:
         return self._get_option_value("monday-filter", None)
@@ -2,31 +2,80 @@
 Maintain the backend SQLite database.
 """
 
+import contextlib
 import csv
 import datetime
+import itertools
+import json
 import logging
 import pathlib
 import sqlite3
-from collections.abc import Mapping
+import threading
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import Any
 
+import cachetools
+
 from daily_tracker import core, utils
 
 logger = logging.getLogger("core")
 
 DEBUG_MODE = False
+# WAL lets the reads carry on while an entry is written, and means that a
+# commit doesn't need to wait for an fsync
+PRAGMAS: Mapping[str, str | int] = {
+    "journal_mode": "wal",
+    "synchronous": "normal",
+    "temp_store": "memory",
+    "cache_size": -64_000,  # In KiB, so about 64 MB
+}
+# The recent tasks only change when an entry is written, or when old tasks
+# drop out of the window (which doesn't need to be noticed straight away)
+RECENT_TASKS_TTL_SECONDS = 60 * 60
+# The full history can be a lot of small rows, so write them in bigger chunks
+CSV_BUFFER_SIZE = 1024 * 1024
 
 
 class DatabaseConnector:
     """
     Connects to an SQLite database.
+
+    The connection can be shared between threads, but only one thread can
+    use it at a time (see ``transaction``).
     """
 
-    def __init__(self, filepath: str) -> None:
+    def __init__(
+        self,
+        filepath: str,
+        pragmas: Mapping[str, str | int] = PRAGMAS,
+    ) -> None:
+        """
+        :param filepath: The path to the SQLite database file.
+        :param pragmas: The pragmas to set on the connection. Defaults to
+            ``PRAGMAS``.
+        """
+
         self.filepath = filepath
-        self.connection = sqlite3.connect(self.filepath, timeout=15)
+        self.connection = sqlite3.connect(
+            self.filepath,
+            timeout=15,
+            check_same_thread=False,
+        )
+        for pragma, value in pragmas.items():
+            self.connection.execute(f"pragma {pragma} = {value}")
+        self._lock = threading.RLock()
         self._create_backend()
 
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Hold the connection for a single transaction, which is committed if
+        the block succeeds and rolled back otherwise.
+        """
+
+        with self._lock, self.connection as conn:
+            yield conn
+
     def execute(
         self,
         sql: str,
@@ -41,46 +90,63 @@ class DatabaseConnector:
     def run_query_from_file(self, filepath: str) -> sqlite3.Cursor:
         """
         Open a file and execute the query inside it.
+
+        The script could create or drop tables, so the known tables are
+        refreshed afterwards.
         """
 
         with open(filepath) as f:
-            return self.connection.executescript(f.read())
+            cursor = self.connection.executescript(f.read())
+        self._refresh_tables()
 
-    def _create_backend(self) -> None:
+        return cursor
+
+    def _refresh_tables(self) -> None:
         """
-        Create the backend if it doesn't already exist.
+        Read the names of the tables in the database.
+
+        The schema is only changed through ``run_query_from_file``, so the
+        names are kept rather than checked on each ``truncate_table``.
         """
 
-        if not (
-            self.connection.execute(
+        self._tables = frozenset(
+            name
+            for (name,) in self.connection.execute(
                 """
                 select name
                 from sqlite_master
                 where type = 'table'
-                  and name = 'tracker'
                 """
-            ).fetchone()
-        ):
+            )
+        )
+
+    def _create_backend(self) -> None:
+        """
+        Create the backend if it doesn't already exist, and add any indexes
+        that are missing from older databases.
+        """
+
+        self._refresh_tables()
+        if "tracker" not in self._tables:
             self.run_query_from_file(
                 utils.DAILY_TRACKER / "core/scripts/create.sql"
             )
+        self.run_query_from_file(
+            utils.DAILY_TRACKER / "core/scripts/indexes.sql"
+        )
 
     def truncate_table(self, table_name: str) -> None:
         """
         Truncate a table if it exists.
+
+        There's no ``where`` clause so that SQLite can use its truncate
+        optimisation, which drops the pages rather than deleting row by row
+        (this only applies to tables without triggers).
         """
 
-        if self.connection.execute(
-            """
-                select name
-                from sqlite_master
-                where type = 'table'
-                  and name = :table_name
-                """,
-            {"table_name": table_name},
-        ).fetchone():
+        if table_name in self._tables:
             self.connection.execute(
-                f"""delete from {table_name} where 1=1"""  # noqa: S608
+                f"""delete from {table_name}"""  # noqa: S608
             )
 
 
@@ -93,18 +159,19 @@ def read_sql(
     Return the result set from running SQL on a database connection.
     """
 
-    with con.connection as conn:
-        results = conn.execute(sql, params)
-
-    return results.fetchall()
+    with con.transaction() as conn:
+        return conn.execute(sql, params).fetchall()
 
 
-def to_csv(data: list[tuple[Any, ...]], path: pathlib.Path) -> None:
+def to_csv(data: Iterable[Sequence[Any]], path: pathlib.Path) -> None:
     """
     Write the data to a CSV file.
+
+    The data can be any iterable (such as a cursor), so the rows are
+    streamed into the file rather than all held in memory.
     """
 
-    with open(path, "w", newline="") as out:
+    with open(path, "w", newline="", buffering=CSV_BUFFER_SIZE) as out:
         csv.writer(out).writerows(data)
 
 
@@ -124,6 +191,25 @@ class Database(core.Input, core.Output):
         logger.debug(f"Loading database file at {database_filepath}...")
         self.connection = DatabaseConnector(database_filepath)
         self.configuration = configuration
+        self._recent_tasks_cache = cachetools.TTLCache(
+            maxsize=8,
+            ttl=RECENT_TASKS_TTL_SECONDS,
+        )
+        self._details_cache = cachetools.LRUCache(maxsize=128)
+
+    def _invalidate_caches(self, task: str | None = None) -> None:
+        """
+        Clear the cached query results after the tracker table changes.
+
+        Only the details for ``task`` are cleared if it's given, since the
+        details of the other tasks can't have changed.
+        """
+
+        self._recent_tasks_cache.clear()
+        if task is None:
+            self._details_cache.clear()
+        else:
+            self._details_cache.pop(task, None)
 
     def debug(self) -> tuple[int, str]:
         try:
@@ -139,49 +225,51 @@ class Database(core.Input, core.Output):
         Truncate the tables in the database that are updated through the form.
         """
 
-        for table in ["tracker", "task_last_detail"]:
-            self.connection.truncate_table(table_name=table)
-        self.connection.connection.commit()
+        with self.connection.transaction():
+            for table in ["tracker", "task_last_detail"]:
+                self.connection.truncate_table(table_name=table)
+        self._invalidate_caches()
 
     def import_history(self, filepath: str) -> None:
         """
         Import the existing CSV file into the SQLite database.
+
+        This replaces the existing history, and is done in a single
+        transaction so that the rows aren't committed one at a time.
         """
 
-        raise NotImplementedError(
-            "'Database.import_history' has not been implemented."
-        )
-        # column_names = [
-        #     "date_time",
-        #     "task",
-        #     "detail",
-        #     "interval",
-        # ]
-        # data = (
-        #     pd.read_csv(
-        #         filepath_or_buffer=filepath,
-        #         usecols=column_names,
-        #         parse_dates=["date_time"]
-        #     )[column_names]
-        #     .fillna("")
-        # )
-        # data["date_time"] = data["date_time"].dt.strftime("%Y-%m-%d %H:%M:%S")
-        #
-        # self.truncate_tables()
-        # with self.connection.connection as conn:
-        #     conn.execute(
-        #         """
-        #         INSERT INTO task_last_detail(task, detail, last_date_time)
-        #             SELECT task, '', '' FROM default_tasks
-        #         """
-        #     )
-        #
-        # data.to_sql(
-        #     name="tracker",
-        #     con=self.connection.engine,
-        #     if_exists="append",
-        #     index=False,
-        # )
+        with (
+            open(filepath, newline="") as f,
+            self.connection.transaction() as conn,
+        ):
+            for table in ["tracker", "task_last_detail"]:
+                self.connection.truncate_table(table_name=table)
+            conn.execute(
+                """
+                insert into task_last_detail(task, detail, last_date_time)
+                    select task, '', '' from default_tasks
+                """
+            )
+            conn.executemany(
+                """
+                insert into tracker(date_time, task, detail, interval)
+                    values (?, ?, ?, ?)
+                """,
+                # The rows are streamed from the file, so only one row is
+                # held in memory at a time
+                (
+                    (
+                        datetime.datetime.fromisoformat(
+                            row["date_time"]
+                        ).isoformat(sep=" ", timespec="seconds"),
+                        row["task"] or "",
+                        row["detail"] or "",
+                        row["interval"] or "",
+                    )
+                    for row in csv.DictReader(f)
+                ),
+            )
+        self._invalidate_caches()
 
     def on_event(self, date_time: datetime.datetime) -> list[core.Task]:
         """
@@ -193,27 +281,29 @@ class Database(core.Input, core.Output):
         )
         recent_tasks_with_defaults = self.get_recent_tasks_with_defaults(
             show_last_n_weeks=self.configuration.show_last_n_weeks
-        ).items()
+        )
 
-        return (
-            []
-            + [
+        tasks = []
+        # There's no latest task when the tracker is empty
+        if latest_task_and_detail is not None:
+            tasks.append(
                 core.Task(
                     task_name=latest_task_and_detail[0],
                     details=[latest_task_and_detail[1]],
                     priority=0,
                 )
-            ]
-            + [
-                core.Task(
-                    task_name=task,
-                    details=[],
-                    is_default=bool(default_flag),
-                )
-                for task, default_flag in recent_tasks_with_defaults
-            ]
+            )
+        tasks.extend(
+            core.Task(
+                task_name=task,
+                details=[],
+                is_default=bool(default_flag),
+            )
+            for task, default_flag in recent_tasks_with_defaults
         )
 
+        return tasks
+
     def get_last_task_and_detail(
         self,
         date_time: datetime.datetime,
@@ -222,7 +312,7 @@ class Database(core.Input, core.Output):
         Return the most recent task and its detail.
         """
 
-        with self.connection.connection as conn:
+        with self.connection.transaction() as conn:
             return conn.execute(
                 """
                 select task, detail
@@ -231,7 +321,7 @@ class Database(core.Input, core.Output):
                 order by date_time desc
                 limit 1
                 """,
-                {"date_time": date_time.strftime("%Y-%m-%d %H:%M:%S")},
+                {"date_time": date_time.isoformat(sep=" ", timespec="seconds")},
             ).fetchone()
 
     def get_recent_tasks(self, show_last_n_weeks: int) -> dict[str, str]:
@@ -241,74 +331,134 @@ class Database(core.Input, core.Output):
         This takes the result of a query into a dataframe, and then converts the
         dataframe into a dictionary whose keys are the tasks and the values are
         the task's latest detail.
+
+        The result is cached until an entry is written (or for an hour).
         """
 
+        key = ("recent_tasks", show_last_n_weeks)
+        if (recent_tasks := self._recent_tasks_cache.get(key)) is not None:
+            return dict(recent_tasks)
+
         # latest_tasks = """
         #     select task, detail
         #     from v_latest_tasks
-        #     where last_date_time >= datetime('now', :date_modifier)
+        #     where last_date_time >= datetime('now', '-' || :days || ' days')
         #        or indx = 0  /* Defaults */
         #     order by indx, task
         # """
         latest_tasks = """
             select task, detail
             from task_detail_with_defaults
-            where last_date_time >= datetime('now', :date_modifier)
+            where last_date_time >= datetime('now', '-' || :days || ' days')
                or indx = 0  /* Defaults */
             order by indx, task
         """
         output = read_sql(
             sql=latest_tasks,
             con=self.connection,
-            params={"date_modifier": f"-{show_last_n_weeks * 7} days"},
+            params={"days": show_last_n_weeks * 7},
         )
+        self._recent_tasks_cache[key] = dict(output)
 
         return dict(output)  # type: ignore
 
     def get_recent_tasks_with_defaults(
         self,
         show_last_n_weeks: int,
-    ) -> dict[str, str]:
+    ) -> list[tuple[str, int]]:
         """
         Return the drop-down list of recent tasks with a flag to indicate
-        default tasks.
+        default tasks, as ``(task, default_flag)`` pairs.
+
+        The result is cached in the same way as ``get_recent_tasks``.
         """
 
+        key = ("recent_tasks_with_defaults", show_last_n_weeks)
+        if (recent_tasks := self._recent_tasks_cache.get(key)) is not None:
+            return list(recent_tasks)
+
         latest_tasks = """
             select task, (indx = 0) as default_flag
             from task_detail_with_defaults
-            where last_date_time >= datetime('now', :date_modifier)
+            where last_date_time >= datetime('now', '-' || :days || ' days')
                or indx = 0  /* Defaults */
             order by indx, task
         """
         output = read_sql(
             sql=latest_tasks,
             con=self.connection,
-            params={"date_modifier": f"-{show_last_n_weeks * 7} days"},
+            params={"days": show_last_n_weeks * 7},
         )
+        self._recent_tasks_cache[key] = output
 
-        return dict(output)  # type: ignore
+        return list(output)
 
     def get_details_for_task(self, task: str) -> list:
         """
         Return the list of recent detail for the task.
 
-        TODO: Use memoisation/caching to avoid repeated queries to the DB.
+        The details are cached until an entry is written for the task.
         """
 
-        details = self.connection.execute(
-            """
-            select detail
-            from tracker
-            where task = :task
-            group by detail
-            order by max(date_time) desc
-            limit 10
-            """,
-            {"task": task},
-        ).fetchall()
+        if (details := self._details_cache.get(task)) is not None:
+            return list(details)
 
-        return [detail[0] for detail in details]
+        with self.connection.transaction() as conn:
+            details = conn.execute(
+                """
+                select detail
+                from tracker
+                where task = :task
+                group by detail
+                order by max(date_time) desc
+                limit 10
+                """,
+                {"task": task},
+            ).fetchall()
+        self._details_cache[task] = [detail[0] for detail in details]
+
+        return list(self._details_cache[task])
+
+    def get_details_for_tasks(
+        self,
+        tasks: Sequence[str],
+    ) -> dict[str, list[str]]:
+        """
+        Return the lists of recent details for each of the tasks.
+
+        This is the same as ``get_details_for_task``, but for several tasks in
+        a single query.
+        """
+
+        with self.connection.transaction() as conn:
+            details = conn.execute(
+                """
+                with details as (
+                    select
+                        task,
+                        detail,
+                        row_number() over (
+                            partition by task
+                            order by max(date_time) desc
+                        ) as detail_rank
+                    from tracker
+                    where task in (select value from json_each(:tasks))
+                    group by task, detail
+                )
+
+                select task, detail
+                from details
+                where detail_rank <= 10
+                order by task, detail_rank
+                """,
+                {"tasks": json.dumps(list(tasks))},
+            ).fetchall()
+
+        details_by_task = {task: [] for task in tasks}
+        for task, detail in details:
+            details_by_task[task].append(detail)
+
+        return details_by_task
 
     def post_event(self, entry: core.Entry) -> None:
         """
@@ -341,19 +491,22 @@ class Database(core.Input, core.Output):
         Write the form values to the database.
         """
 
-        with self.connection.connection as conn:
+        with self.connection.transaction() as conn:
             conn.execute(
                 """
                 insert into tracker(date_time, task, detail, interval)
                     values (:at_datetime, :task, :detail, :interval)
                 """,
                 {
-                    "at_datetime": at_datetime.strftime("%Y-%m-%d %H:%M:%S"),
+                    "at_datetime": at_datetime.isoformat(
+                        sep=" ", timespec="seconds"
+                    ),
                     "task": task,
                     "detail": detail,
                     "interval": interval,
                 },
             )
+        self._invalidate_caches(task)
 
     def write_to_csv(
         self,
@@ -374,19 +527,22 @@ class Database(core.Input, core.Output):
                 detail,
                 interval
             from tracker
-            where date_time >= date('now', :date_modifier)
+            where :days is null
+               or date_time >= date('now', '-' || :days || ' days')
             order by date_time
         """
-        result = read_sql(
-            sql=tracker_history,
-            con=self.connection,
-            params={"date_modifier": f"-{previous_days} days"},
-        )
         headers = [("date_time", "task", "detail", "interval")]
-        to_csv(
-            data=headers + result,
-            path=(
-                pathlib.Path(filepath)
-                / f"daily-tracker-{datetime.datetime.now().strftime('%Y-%m-%d')}.csv"
-            ),
-        )
+        with self.connection.transaction() as conn:
+            to_csv(
+                data=itertools.chain(
+                    headers,
+                    conn.execute(
+                        tracker_history,
+                        {"days": previous_days},
+                    ),
+                ),
+                path=(
+                    pathlib.Path(filepath)
+                    / f"daily-tracker-{datetime.datetime.now().strftime('%Y-%m-%d')}.csv"
+                ),
+            )
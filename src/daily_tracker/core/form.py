@@ -7,11 +7,13 @@ https://github.com/codefirstio/tkinter-data-entry
 
 from __future__ import annotations
 
-import collections
+import bisect
 import datetime
+import functools
 import logging
 import textwrap
 import tkinter
+from collections.abc import Sequence
 from tkinter import ttk
 
 import ttkthemes
@@ -22,6 +24,36 @@ from daily_tracker.core import database
 logger = logging.getLogger("core")
 
 ICON = utils.DAILY_TRACKER / "resources/clock-icon.png"
+# Tk renders every drop-down value, so only show a handful at a time
+MAX_DROPDOWN_VALUES = 50
+# Wait for a pause in typing before updating the details for the project
+PROJECT_CHANGE_DELAY_MS = 150
+ENTRY_LOG_TEMPLATE = textwrap.dedent(
+    f"""
+    {30 * "-"}
+    Project:  %s
+    Detail:   %s
+    Interval: %s
+    Datetime: %s
+    {30 * "-"}
+    """
+)
+
+
+@functools.cache
+def _get_root() -> ttkthemes.ThemedTk:
+    """
+    Return the root window that the pop-ups are shown in.
+
+    Creating the root window starts Tk and loads the theme and the icon, so
+    this is only done once, and the window is hidden between pop-ups.
+    """
+
+    root = ttkthemes.ThemedTk(theme="arc")
+    root.iconphoto(True, tkinter.PhotoImage(file=ICON))
+    root.withdraw()
+
+    return root
 
 
 class TrackerForm:
@@ -29,12 +61,37 @@ class TrackerForm:
     The pop-up box for the tracker.
     """
 
+    __slots__ = (
+        "_detail",
+        "_detail_at_project_change",
+        "_details_by_task",
+        "_frame",
+        "_height",
+        "_pending_project_change",
+        "_root",
+        "_task",
+        "_width",
+        "action_handler",
+        "at_datetime",
+        "date_time",
+        "defaults",
+        "detail_text_box",
+        "interval",
+        "options",
+        "project_text_box",
+        "tasks",
+        "title",
+    )
+
     at_datetime: datetime.datetime
     action_handler: _actions.ActionHandler
     interval: int
+    date_time: str
+    title: str
     _width: int
     _height: int
     _root: ttkthemes.ThemedTk
+    _frame: ttk.Frame
     project_text_box: TextBox
     detail_text_box: TextBox
 
@@ -42,7 +99,12 @@ class TrackerForm:
     defaults: tuple[str, str]
 
     options: dict[str, list[str]]
-    # project_details: dict[str, list[str]]  # See `task_details` below
+    tasks: tuple[str, ...]
+    _details_by_task: dict[str, list[str]]
+    _pending_project_change: str | None
+    _task: str
+    _detail: str
+    _detail_at_project_change: str
 
     def __init__(
         self,
@@ -57,6 +119,8 @@ class TrackerForm:
         self.at_datetime = at_datetime
         self.action_handler = action_handler
         self.interval = self.action_handler.configuration.interval
+        self.date_time = self.at_datetime.strftime("%H:%M")
+        self.title = f"Interval Tracker at {self.date_time} ({self.interval})"
         self._width = 500  # 350
         self._height = 150
         self.defaults = self.action_handler.do_on_events(
@@ -65,123 +129,160 @@ class TrackerForm:
         self.options = self.action_handler.get_dropdown_options(
             jira_filter=self.action_handler.configuration.jira_filter,
         )
+        # Tk takes tuples as they are, so there's no need to copy into lists
+        self.tasks = tuple(self.options)
+        self._details_by_task = self._database_handler.get_details_for_tasks(
+            self.tasks
+        )
+        self._pending_project_change = None
+
+    @property
+    def _database_handler(self) -> database.Database:
+        """
+        Return the database handler.
+        """
+
+        return self.action_handler.inputs["database"]  # type: ignore
 
     @property
     def task(self) -> str:
         """
         Return the current task value.
+
+        This is kept up to date by the text box's variable trace rather than
+        asking Tk for it on every access.
         """
 
-        return self.project_text_box.text_box.get()
+        return self._task
 
     @property
     def detail(self) -> str:
         """
         Return the current detail value.
+
+        This is kept up to date by the text box's variable trace rather than
+        asking Tk for it on every access.
         """
 
-        return self.detail_text_box.text_box.get()
+        return self._detail
 
     @property
     def task_details(self) -> list[str]:
         """
         Return the current task's details.
 
-        TODO: This should be given as an argument -- we don't want to have to
-              talk to the database here (I think).
+        The details for the drop-down tasks are fetched up front, so the
+        database is only queried for tasks that aren't in the drop-down.
         """
 
-        # fmt: off
-        database_handler: database.Database = self.action_handler.inputs["database"]  # type: ignore
-        recent_details: list[str] = database_handler.get_details_for_task(self.task)
-        # fmt: on
+        recent_details = self._details_by_task.get(self.task)
+        if recent_details is None:
+            recent_details = self._database_handler.get_details_for_task(
+                self.task
+            )
 
-        task_and_details = collections.defaultdict(list)
-        task_and_details[self.task].extend(recent_details)
-        task_and_details[self.task].extend(
-            iter(self.options.get(self.task, []))
+        return list(
+            dict.fromkeys(
+                [
+                    *recent_details,
+                    *self.options.get(self.task, []),
+                ]
+            )
         )
 
-        return list(dict.fromkeys(task_and_details[self.task]))
-
-    @property
-    def date_time(self) -> str:
-        """
-        Return the pop-up datetime in the hh:mm format.
-        """
-
-        return self.at_datetime.strftime("%H:%M")
-
-    @property
-    def title(self) -> str:
-        """
-        Return the title to use for the pop-up.
-        """
-
-        return f"Interval Tracker at {self.date_time} ({self.interval})"
-
     def close_form(self) -> None:
         """
         Close the form window.
+
+        The root window is only hidden so that it can be reused by the next
+        pop-up; only this form's widgets are destroyed.
         """
 
-        self._root.destroy()
-        # self._root.quit()
-        # self._root.protocol("WM_DELETE_WINDOW", lambda: sys.exit())
-        # self._root.protocol("WM_DELETE_WINDOW", self._root.destroy)
+        if self._pending_project_change is not None:
+            self._root.after_cancel(self._pending_project_change)
+            self._pending_project_change = None
+
+        self._frame.destroy()
+        self._root.withdraw()
+        self._root.quit()
 
     def action_wrapper(self) -> None:
         """
         Wrap the action so that we can schedule the next event when it's called.
         """
 
+        if self._pending_project_change is not None:
+            self._root.after_cancel(self._pending_project_change)
+            self.update_details()
+
         self.action_handler.do_post_events()
-        logger.info(
-            textwrap.dedent(
-                f"""
-                {30 * "-"}
-                Project:  {self.task}
-                Detail:   {self.detail}
-                Interval: {self.interval}
-                Datetime: {self.at_datetime.strftime("%Y-%m-%d %H:%M:%S")}
-                {30 * "-"}
-                """
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                ENTRY_LOG_TEMPLATE,
+                self.task,
+                self.detail,
+                self.interval,
+                self.at_datetime.strftime("%Y-%m-%d %H:%M:%S"),
             )
-        )
         self.close_form()
 
     def on_project_change(self, *_) -> None:  # noqa: ANN002
         """
         When the value of the Project box changes, update the Detail box with
         the latest value from the Project.
+
+        The update waits for a pause in typing so that a burst of keystrokes
+        only updates the Detail box once. The Detail box's value is noted now
+        so that the update can tell whether it's been edited in the meantime.
         """
 
-        details = self.task_details
-        self.detail_text_box.text_box["values"] = details
-        self.detail_text_box.text_box.set(details[0] if details else "")
+        task = self.project_text_box.variable.get()
+        if task == self._task:
+            return
+
+        self._task = task
+        self._detail_at_project_change = self._detail
+        if self._pending_project_change is not None:
+            self._root.after_cancel(self._pending_project_change)
+        self._pending_project_change = self._root.after(
+            PROJECT_CHANGE_DELAY_MS,
+            self.update_details,
+        )
 
-    def ok_shortcut(self, event: tkinter.Event) -> None:
+    def update_details(self) -> None:
         """
-        Enable keyboard shortcut CTRL + ENTER to the OK button.
+        Update the Detail box with the details for the current Project.
 
-        https://youtu.be/ibf5cx221hk
+        The Detail box's value is only replaced if it hasn't been edited
+        since the Project changed, so that it doesn't overwrite what the user
+        has started typing.
         """
 
-        if event.state == 12 and event.keysym == "Return":  # noqa: PLR2004
-            self.action_wrapper()
+        self._pending_project_change = None
+        details = self.task_details
+        self.detail_text_box.set_values(details)
+        if self._detail == self._detail_at_project_change:
+            self.detail_text_box.text_box.set(details[0] if details else "")
+
+    def on_detail_change(self, *_) -> None:  # noqa: ANN002
+        """
+        When the value of the Detail box changes, keep track of it.
+        """
+
+        self._detail = self.detail_text_box.variable.get()
 
     def generate_form(self) -> None:
         """
         Generate the tracker pop-up form.
         """
 
-        self._root = ttkthemes.ThemedTk(theme="arc")
+        self._root = _get_root()
+        self._root.protocol("WM_DELETE_WINDOW", self.close_form)
         self._root.geometry(f"{self._width}x{self._height}")
         self._root.eval("tk::PlaceWindow . center")
         self._root.title(self.title)
-        self._root.iconphoto(True, tkinter.PhotoImage(file=ICON))
 
-        form_frame = ttk.Frame(self._root)
+        form_frame = self._frame = ttk.Frame(self._root)
         form_frame.pack(expand=tkinter.YES, fill="both")
 
         text_box_frame = ttk.LabelFrame(
@@ -208,6 +309,8 @@ class TrackerForm:
         self.set_text_boxes(text_box_frame)
         self.set_buttons(button_frame)
 
+        self._root.deiconify()
+        self._root.focus_force()
         self._root.mainloop()
 
     def set_text_boxes(self, text_box_frame: ttk.LabelFrame) -> None:
@@ -219,20 +322,30 @@ class TrackerForm:
             parent=text_box_frame,
             label_text="Project",
             default=self.defaults[0],
-            values=list(self.options),
+            values=self.tasks,
         )
+        self._task = self.defaults[0]
         self.detail_text_box = TextBox(
             parent=text_box_frame,
             label_text="Detail",
             default=self.defaults[1],
             values=self.task_details,
         )
+        self._detail = self._detail_at_project_change = self.defaults[1]
 
-        self.project_text_box.text_box.bind("<KeyPress>", self.ok_shortcut)
-        self.detail_text_box.text_box.bind("<KeyPress>", self.ok_shortcut)
+        # CTRL + ENTER is a shortcut for the OK button
+        for text_box in [self.project_text_box, self.detail_text_box]:
+            text_box.text_box.bind(
+                "<Control-Return>",
+                lambda _: self.action_wrapper(),
+            )
 
-        # self.project_text_box.text_box.bind("<Key>", self.on_project_change)
-        self.project_text_box.variable.trace("w", self.on_project_change)
+        # The traces are added after the defaults are set so that they don't
+        # fire (and look up the details again) while the form is built
+        self.project_text_box.variable.trace_add(
+            "write", self.on_project_change
+        )
+        self.detail_text_box.variable.trace_add("write", self.on_detail_change)
 
     def set_buttons(self, button_frame: ttk.Frame) -> None:
         """
@@ -263,9 +376,20 @@ class TextBox:
     A text box with a label for the main form.
     """
 
+    __slots__ = (
+        "_sorted_keys",
+        "_sorted_values",
+        "frame",
+        "label_text",
+        "parent",
+        "text_box",
+        "values",
+        "variable",
+    )
+
     parent: ttk.LabelFrame
     label_text: str
-    values: list[str]
+    values: Sequence[str]
     frame: ttk.Frame
     variable: tkinter.StringVar
     text_box: ttk.Combobox
@@ -275,7 +399,7 @@ class TextBox:
         parent: ttk.LabelFrame,
         label_text: str,
         default: str,
-        values: list[str],
+        values: Sequence[str],
     ) -> None:
         """
         Set the text box properties and create the widget.
@@ -283,8 +407,43 @@ class TextBox:
 
         self.parent = parent
         self.label_text = label_text
-        self.values = values
         self.frame = self._build(default)
+        self.set_values(values)
+        self.text_box.bind("<KeyRelease>", self.filter_values, add="+")
+
+    def set_values(self, values: Sequence[str]) -> None:
+        """
+        Set the values that the drop-down can show.
+
+        Only the first ``MAX_DROPDOWN_VALUES`` of them are shown until the
+        user starts typing.
+        """
+
+        self.values = values
+        self._sorted_values = sorted(values, key=str.lower)
+        self._sorted_keys = [value.lower() for value in self._sorted_values]
+        self.text_box["values"] = values[:MAX_DROPDOWN_VALUES]
+
+    def filter_values(self, *_) -> None:  # noqa: ANN002
+        """
+        Show the values that start with the text typed so far.
+
+        The matches are found with a binary search over the sorted values.
+        """
+
+        prefix = self.text_box.get().lower()
+        if not prefix:
+            self.text_box["values"] = self.values[:MAX_DROPDOWN_VALUES]
+            return
+
+        start = bisect.bisect_left(self._sorted_keys, prefix)
+        end = bisect.bisect_right(
+            self._sorted_keys,
+            prefix + chr(0x10FFFF),
+            lo=start,
+            hi=min(start + MAX_DROPDOWN_VALUES, len(self._sorted_keys)),
+        )
+        self.text_box["values"] = self._sorted_values[start:end]
 
     def _build(self, default: str) -> ttk.Frame:
         """
@@ -307,7 +466,6 @@ class TextBox:
             frame,
             textvariable=text_box_value,
             width=40,
-            values=self.values,
         )
 
         self.variable = text_box_value
@@ -5,9 +5,9 @@ The scheduler, which is responsible for scheduling the events.
 from __future__ import annotations
 
 import datetime
+import functools
 import logging
-import sched
-import time
+import threading
 from collections.abc import Callable
 from typing import Any
 
@@ -17,6 +17,11 @@ logger = logging.getLogger("core")
 
 Action = Callable[[datetime.datetime], Any]
 
+# Re-check the clock at least this often in case the computer was asleep
+MAX_WAIT_SECONDS = 60
+# How long before each event the preparation is done
+PREPARE_AHEAD = datetime.timedelta(seconds=60)
+
 
 def _get_interval_from_configuration() -> int:
     """
@@ -24,6 +29,8 @@ def _get_interval_from_configuration() -> int:
 
     It's important to re-call this so that updates to the configuration file
     while the scheduler is running can be reflected in the scheduled events.
+    This is cheap: the file is only parsed again when it has been modified
+    (see ``Configuration.from_default``).
     """
 
     return core.Configuration.from_default().interval
@@ -48,30 +55,31 @@ def get_next_interval(
     :return: The next scheduled datetime.
     """
 
-    return datetime.timedelta(minutes=interval_in_minutes) + datetime.datetime(
-        year=from_time.year,
-        month=from_time.month,
-        day=from_time.day,
-        hour=from_time.hour,
+    return from_time.replace(
         minute=from_time.minute - (from_time.minute % interval_in_minutes),
         second=0,
-    )
+        microsecond=0,
+    ) + datetime.timedelta(minutes=interval_in_minutes)
 
 
 class IndefiniteScheduler:
     """
     A processor that schedules the pop-up boxes and passes the data around
     to various applications indefinitely.
+
+    The events are run on the thread that starts the scheduler, since the
+    pop-up box (Tk) needs to run on the main thread.
     """
 
     _interval: int
+    _get_next_interval: Callable[[datetime.datetime], datetime.datetime]
     _next_schedule_time: datetime.datetime
-    _next_event: sched.Event | None
     _running: bool
-    _scheduler: sched.scheduler
+    _stopped: threading.Event
     action: Action
+    prepare: Action | None
 
-    def __init__(self, action: Action) -> None:
+    def __init__(self, action: Action, prepare: Action | None = None) -> None:
         """
         Create the scheduler to call the ``action`` on a schedule.
 
@@ -79,12 +87,17 @@ class IndefiniteScheduler:
         configuration file.
 
         :param action: The function to call when the schedule is executed.
+        :param prepare: An optional function to call shortly before each
+            scheduled event, with the datetime of that event. This is for
+            warming up anything that the action needs, so that the action
+            itself isn't held up. Errors from it are logged and ignored.
         """
 
-        self._interval = _get_interval_from_configuration()
+        self._set_interval(_get_interval_from_configuration())
         self._running = False
-        self._scheduler = sched.scheduler(time.time, time.sleep)
+        self._stopped = threading.Event()
         self.action = action
+        self.prepare = prepare
 
     def _action_wrapper(self) -> None:
         """
@@ -92,36 +105,68 @@ class IndefiniteScheduler:
         """
 
         self.action(self._next_schedule_time)
-        self._interval = _get_interval_from_configuration()
+        self._set_interval(_get_interval_from_configuration())
         self._schedule_next()
 
-    def _schedule(self, cancel: bool = False) -> None:
+    def _prepare(self) -> None:
+        """
+        Run the preparation for the next event, if there is any.
+        """
+
+        if self.prepare is None:
+            return
+
+        try:
+            self.prepare(self._next_schedule_time)
+        except Exception as e:
+            logger.warning(f"Could not prepare for the next event: {e}")
+
+    def _set_interval(self, interval: int) -> None:
+        """
+        Set the interval, and the function that derives the next schedule
+        time from it.
+
+        The function is only rebuilt when the interval changes.
+        """
+
+        if getattr(self, "_interval", None) == interval:
+            return
+
+        self._interval = interval
+        self._get_next_interval = functools.partial(
+            get_next_interval,
+            interval_in_minutes=interval,
+        )
+
+    def _wait_until(self, wait_until: datetime.datetime) -> bool:
         """
-        Schedule (or cancel) the next event.
+        Wait until the datetime, returning ``False`` if the scheduler was
+        cancelled in the meantime.
+
+        The wait is broken up so that the wall clock is re-checked
+        regularly, which keeps the schedule on time after the computer
+        sleeps.
         """
 
-        if cancel:
-            self._scheduler.cancel(self._next_event)
-            self._next_event = None
-        else:
-            self._next_event = self._scheduler.enterabs(
-                time=self._next_schedule_time.timestamp(),
-                priority=1,
-                action=self._action_wrapper,
-            )
+        while (
+            remaining := (wait_until - datetime.datetime.now()).total_seconds()
+        ) > 0:
+            if self._stopped.wait(timeout=min(remaining, MAX_WAIT_SECONDS)):
+                return False
+
+        return not self._stopped.is_set()
 
     def _schedule_next(self) -> None:
         """
         Schedule the next event.
         """
 
-        assert self._running  # noqa: S101
+        if not self._running:
+            return
 
-        self._next_schedule_time = get_next_interval(
-            from_time=self._next_schedule_time,
-            interval_in_minutes=self._interval,
+        self._next_schedule_time = self._get_next_interval(
+            self._next_schedule_time
         )
-        self._schedule()
         logger.debug(f"Next event scheduled for {self._next_schedule_time}")
 
     def _cancel_next(self) -> None:
@@ -129,20 +174,29 @@ class IndefiniteScheduler:
         Cancel the next event.
         """
 
-        self._schedule(cancel=True)
         self._running = False
+        self._stopped.set()
 
     def schedule_first(
         self,
         schedule_at: datetime.datetime = datetime.datetime.now(),  # noqa: B008
     ) -> None:
         """
-        Schedule the first event.
+        Schedule the first event, and then keep running the events until the
+        scheduler is cancelled.
         """
 
         assert not self._running, "The scheduler is already running."  # noqa: S101
 
         self._running = True
+        self._stopped.clear()
         self._next_schedule_time = schedule_at
         self._schedule_next()
-        self._scheduler.run()
+        while self._running and self._wait_until(
+            self._next_schedule_time - PREPARE_AHEAD
+        ):
+            self._prepare()
+            if not self._wait_until(self._next_schedule_time):
+                break
+
+            self._action_wrapper()
@@ -0,0 +1,12 @@
+
+/*
+    + tracker +
+    The recent details for a task are grouped by detail and ordered by their
+    latest date-time, which this index covers without touching the table.
+
+    The date-time is already indexed by its primary key. This script is run
+    on every connection, so it must be safe to re-run.
+*/
+create index if not exists tracker_task_detail_date_time
+    on tracker(task, detail, date_time)
+;
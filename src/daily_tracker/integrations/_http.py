@@ -0,0 +1,81 @@
+"""
+Shared HTTP helpers for the integrations that talk to REST APIs.
+"""
+
+import http
+
+import requests
+import requests.adapters
+import urllib3.util
+
+POOL_SIZE = 4
+# The (connect, read) timeouts, so that a hung server can't hold up a thread
+# (or the process exiting) forever
+REQUEST_TIMEOUT_SECONDS = (5, 30)
+# Rate limits and gateway hiccups are worth retrying, other failures aren't
+RETRY_STATUSES = (
+    http.HTTPStatus.TOO_MANY_REQUESTS,
+    http.HTTPStatus.BAD_GATEWAY,
+    http.HTTPStatus.SERVICE_UNAVAILABLE,
+    http.HTTPStatus.GATEWAY_TIMEOUT,
+)
+
+
+class _TimeoutHTTPAdapter(requests.adapters.HTTPAdapter):
+    """
+    An adapter that uses the ``REQUEST_TIMEOUT_SECONDS`` for the requests
+    that don't set their own timeout.
+    """
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        timeout: float | tuple[float, float] | None = None,
+        **kwargs,  # noqa: ANN003
+    ) -> requests.Response:
+        return super().send(
+            request,
+            timeout=REQUEST_TIMEOUT_SECONDS if timeout is None else timeout,
+            **kwargs,
+        )
+
+
+def create_session(retry_posts: bool = False) -> requests.Session:
+    """
+    Return a session that keeps its connections alive between requests.
+
+    The integrations live for the whole process, so reusing the session
+    saves a TLS handshake on each pop-up. Requests that fail to connect, or
+    that get one of the ``RETRY_STATUSES`` back, are retried a few times
+    with an exponential backoff (plus some jitter). A ``Retry-After`` header
+    on the response is honoured instead of the backoff. Requests time out
+    after the ``REQUEST_TIMEOUT_SECONDS`` unless they set their own timeout.
+
+    By default, only idempotent methods are retried on a bad status so that
+    (for example) a work log is never posted twice. Set ``retry_posts`` for
+    the APIs where a duplicate post is harmless. When the retries run out,
+    the last response is returned so that the caller can decide what to do
+    with it.
+    """
+
+    allowed_methods = urllib3.util.Retry.DEFAULT_ALLOWED_METHODS
+    if retry_posts:
+        allowed_methods |= {"POST"}
+
+    adapter = _TimeoutHTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=urllib3.util.Retry(
+            total=3,
+            backoff_factor=0.5,
+            backoff_max=30,
+            backoff_jitter=0.5,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=allowed_methods,
+            raise_on_status=False,
+        ),
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+
+    return session
@@ -1,23 +1,30 @@
+import importlib
 import sys
 
 from daily_tracker import core
 from daily_tracker.integrations.calendars.calendars import Calendar, NoCalendar
-from daily_tracker.integrations.calendars.google_calendar import GoogleCalendar
 
 if sys.platform == "win32":
-    from daily_tracker.integrations.calendars.outlook_windows import Outlook
+    _OUTLOOK = "daily_tracker.integrations.calendars.outlook_windows:Outlook"
 elif sys.platform == "darwin":
-    from daily_tracker.integrations.calendars.outlook_mac import Outlook
+    _OUTLOOK = "daily_tracker.integrations.calendars.outlook_mac:Outlook"
 else:
-    from daily_tracker.integrations.calendars.calendars import (
-        NoCalendar as Outlook,
-    )
+    _OUTLOOK = "daily_tracker.integrations.calendars.calendars:NoCalendar"
 
+__all__ = [
+    "CALENDAR_LOOKUP",
+    "Calendar",
+    "NoCalendar",
+    "get_linked_calendar",
+]
 
+
+# The calendar modules are only imported once they're linked since their
+# dependencies are slow to import (and might not be installed)
 CALENDAR_LOOKUP = {
-    "none": NoCalendar,
-    "google": GoogleCalendar,
-    "outlook": Outlook,
+    "none": "daily_tracker.integrations.calendars.calendars:NoCalendar",
+    "google": "daily_tracker.integrations.calendars.google_calendar:GoogleCalendar",
+    "outlook": _OUTLOOK,
 }
 
 
@@ -26,14 +33,23 @@ def get_linked_calendar(configuration: core.Configuration) -> Calendar:
     Convert the input calendar type string to the concrete representation of the
     class.
     Currently, only using a single calendar type is supported.
+
+    If no calendar is linked, the calendar modules aren't imported at all.
     """
 
+    if not configuration.linked_calendar:
+        return NoCalendar(configuration)
+
     calendar = CALENDAR_LOOKUP.get(configuration.linked_calendar)
     if calendar is None:
         raise NotImplementedError(
-            f"The tracker currently does not support connections to {calendar}."
+            "The tracker currently does not support connections to"
+            f" {configuration.linked_calendar}."
             f" The supported connections are:\n"
             f"{','.join(CALENDAR_LOOKUP.keys())}"
         )
 
-    return calendar(configuration)
+    module_name, class_name = calendar.split(":")
+    calendar_class = getattr(importlib.import_module(module_name), class_name)
+
+    return calendar_class(configuration)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import abc
+import bisect
 import dataclasses
 import datetime
 import enum
 import logging
+from collections.abc import Collection
 
 import cachetools
 
@@ -22,7 +24,7 @@ class EventResponse(enum.StrEnum):
 def _filter_appointments(
     at_datetime: datetime.datetime,
     events: list[CalendarEvent],
-    categories_to_exclude: list[str],
+    categories_to_exclude: Collection[str],
 ) -> list:
     """
     Filter out the appointments that are:
@@ -40,7 +42,7 @@ def _filter_appointments(
             1 == 1  # noqa: PLR0133
             and not event.all_day_event
             and not event.response == EventResponse.DECLINED
-            and all(i not in event.categories for i in categories_to_exclude)
+            and event.categories.isdisjoint(categories_to_exclude)
             and (
                 # TODO: Maybe they should just be lower priority, rather than excluded?
                 event.start == at_datetime
@@ -51,7 +53,7 @@ def _filter_appointments(
     ]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CalendarEvent:
     """
     A calendar event, typically referred to as a meeting or an appointment.
@@ -65,6 +67,45 @@ class CalendarEvent:
     response: EventResponse
 
 
+class AppointmentIndex:
+    """
+    The events sorted by their start so that the events on or over a
+    datetime can be found with a binary search rather than a scan.
+    """
+
+    __slots__ = ("_events", "_max_duration", "_starts")
+
+    def __init__(self, events: list[CalendarEvent]) -> None:
+        self._events = sorted(events, key=lambda event: event.start)
+        self._starts = [event.start for event in self._events]
+        # Only the events starting within the longest duration before the
+        # datetime can overlap it
+        self._max_duration = max(
+            (event.end - event.start for event in self._events),
+            default=datetime.timedelta(0),
+        )
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def at(self, at_datetime: datetime.datetime) -> list[CalendarEvent]:
+        """
+        Return the events that are scheduled to on or over the supplied
+        datetime.
+        """
+
+        lower = bisect.bisect_right(
+            self._starts, at_datetime - self._max_duration
+        )
+        upper = bisect.bisect_right(self._starts, at_datetime)
+
+        return [
+            event
+            for event in self._events[lower:upper]
+            if at_datetime < event.end
+        ]
+
+
 class Calendar(abc.ABC):
     """
     Abstraction of the various calendar types that can be synced with the
@@ -85,6 +126,21 @@ class Calendar(abc.ABC):
         (inclusive) and end datetime exclusive.
         """
 
+    @abc.abstractmethod
+    def get_appointments_overlapping_datetimes(
+        self,
+        start_datetime: datetime.datetime,
+        end_datetime: datetime.datetime,
+    ) -> list[CalendarEvent]:
+        """
+        Return the events in the calendar that overlap the start datetime
+        (inclusive) and end datetime (exclusive).
+
+        Unlike ``get_appointments_between_datetimes``, this includes the
+        events that start before the start datetime or end after the end
+        datetime, such as a meeting that runs over midnight.
+        """
+
     @abc.abstractmethod
     def get_appointments_at_datetime(
         self,
@@ -93,15 +149,47 @@ class Calendar(abc.ABC):
         """
         Return the events in the calendar that are scheduled to on or over
         the supplied datetime.
+
+        The pop-ups read from the day's index instead (see ``on_event``), so
+        this is only for one-off lookups like the connection checks.
         """
 
+    @cachetools.cached(cache=cachetools.TTLCache(maxsize=4, ttl=5 * 60))
+    def _get_appointment_index(self, date: datetime.date) -> AppointmentIndex:
+        """
+        Return the index of the events on or over the date.
+
+        The whole day is fetched in one call to the calendar, and is then
+        reused for each pop-up until the cache expires. This includes the
+        events that started the day before or end the day after.
+        """
+
+        start_datetime = datetime.datetime.combine(date, datetime.time())
+
+        return AppointmentIndex(
+            self.get_appointments_overlapping_datetimes(
+                start_datetime=start_datetime,
+                end_datetime=start_datetime + datetime.timedelta(days=1),
+            )
+        )
+
+    def prefetch(self, at_datetime: datetime.datetime) -> None:
+        """
+        Fetch the events for the datetime's day ahead of time, so that the
+        ``on_event`` call at that datetime doesn't wait on the calendar.
+        """
+
+        self._get_appointment_index(at_datetime.date())
+
     @cachetools.cached(cache=cachetools.TTLCache(maxsize=32, ttl=60))
     def _on_event(self, at_datetime: datetime.datetime) -> list[core.Task]:
         """
         Cachable ``on_event`` action.
         """
 
-        all_events = self.get_appointments_at_datetime(at_datetime=at_datetime)
+        all_events = self._get_appointment_index(at_datetime.date()).at(
+            at_datetime
+        )
         s = "s" if len(all_events) != 1 else ""
         logger.debug(
             f"Found {len(all_events)} calendar event{s} for {at_datetime}."
@@ -173,6 +261,20 @@ class NoCalendar(Calendar, core.Input, core.Output):
         )
         return []
 
+    def get_appointments_overlapping_datetimes(
+        self,
+        start_datetime: datetime.datetime,
+        end_datetime: datetime.datetime,
+    ) -> list:
+        """
+        Return an empty list.
+        """
+
+        logger.debug(
+            "Calling 'get_appointments_overlapping_datetimes' for NoCalendar..."
+        )
+        return []
+
     def get_appointments_at_datetime(
         self,
         at_datetime: datetime.datetime,
@@ -74,7 +74,7 @@ def _parse_datetime(dt_dct: dict[str, str]) -> datetime.datetime:
     return datetime.datetime.fromisoformat(dt_str).replace(tzinfo=None)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class GoogleCalendarEvent(CalendarEvent):
     """
     A Google Calendar event.
@@ -105,7 +105,7 @@ class GoogleCalendarEvent(CalendarEvent):
             )
         ]
 
-        return GoogleCalendarEvent(
+        return cls(
             subject=event["summary"],
             start=_parse_datetime(event_start),
             end=_parse_datetime(event_end),
@@ -159,7 +159,7 @@ class GoogleCalendar(Calendar, core.Input):
             calendarId="primary",
             timeMin=start_datetime.isoformat(),
             timeMax=end_datetime.isoformat(),
-            maxResults=10,
+            maxResults=250,
             singleEvents=True,
             orderBy="startTime",
         )
@@ -176,6 +176,24 @@ class GoogleCalendar(Calendar, core.Input):
             for e in events_result.get("items", [])
         ]
 
+    def get_appointments_overlapping_datetimes(
+        self,
+        start_datetime: datetime.datetime,
+        end_datetime: datetime.datetime,
+    ) -> list[GoogleCalendarEvent]:
+        """
+        Return the events in the calendar that overlap the start datetime
+        (inclusive) and end datetime (exclusive).
+
+        The Google API already filters on the overlap (``timeMin`` bounds
+        the end and ``timeMax`` bounds the start).
+        """
+
+        return self.get_appointments_between_datetimes(
+            start_datetime=start_datetime,
+            end_datetime=end_datetime,
+        )
+
     def get_appointments_at_datetime(
         self,
         at_datetime: datetime.datetime,
@@ -41,7 +41,7 @@ from daily_tracker.integrations.calendars.calendars import (
 logger = logging.getLogger("integrations")
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class OutlookEvent(CalendarEvent):
     """
     An Outlook event corresponding to macOS.
@@ -56,12 +56,31 @@ class OutlookEvent(CalendarEvent):
          from.
         """
 
-        return OutlookEvent(
-            subject=appointment.subject.get(),
-            start=appointment.start_time.get(),
-            end=appointment.end_time.get(),
-            categories={cat.name.get() for cat in appointment.category.get()},
-            all_day_event=appointment.start_time.get().hour == 0,
+        return cls.from_properties(appointment.properties.get())
+
+    @classmethod
+    def from_properties(cls, properties: dict) -> OutlookEvent:
+        """
+        Generate an OutlookEvent from the properties of a macOS Outlook
+        appointment.
+
+        Each ``.get()`` is a round trip to Outlook, so the properties should
+        be fetched in one go (ideally for all the appointments at once).
+
+        :param properties: The appscript properties of the appointment to
+         generate the event from.
+        """
+
+        start_time = properties[appscript.k.start_time]
+
+        return cls(
+            subject=properties[appscript.k.subject],
+            start=start_time,
+            end=properties[appscript.k.end_time],
+            categories={
+                cat.name.get() for cat in properties[appscript.k.category]
+            },
+            all_day_event=start_time.hour == 0,
             response=EventResponse.ACCEPTED,
         )
 
@@ -94,9 +113,10 @@ class Outlook(Calendar, core.Input):
             (appscript.its.start_time >= start_datetime).AND(
                 appscript.its.end_time < end_datetime
             )
-        ].get()
+        ].properties.get()
         events = [
-            OutlookEvent.from_appointment(app) for app in restricted_calendar
+            OutlookEvent.from_properties(properties)
+            for properties in restricted_calendar
         ]
 
         s = "s" if len(events) != 1 else ""
@@ -106,6 +126,33 @@ class Outlook(Calendar, core.Input):
 
         return events
 
+    def get_appointments_overlapping_datetimes(
+        self,
+        start_datetime: datetime.datetime,
+        end_datetime: datetime.datetime,
+    ) -> list[OutlookEvent]:
+        """
+        Return the events in the calendar that overlap the start datetime
+        (inclusive) and end datetime (exclusive).
+        """
+
+        restricted_calendar = self.calendar.calendar_events[
+            (appscript.its.start_time < end_datetime).AND(
+                appscript.its.end_time > start_datetime
+            )
+        ].properties.get()
+        events = [
+            OutlookEvent.from_properties(properties)
+            for properties in restricted_calendar
+        ]
+
+        s = "s" if len(events) != 1 else ""
+        logger.debug(
+            f"Found {len(events)} calendar event{s} over {start_datetime} to {end_datetime}."
+        )
+
+        return events
+
     def get_appointments_at_datetime(
         self,
         at_datetime: datetime.datetime,
@@ -119,9 +166,10 @@ class Outlook(Calendar, core.Input):
             (appscript.its.start_time <= at_datetime).AND(
                 appscript.its.end_time > at_datetime
             )
-        ].get()
+        ].properties.get()
         events = [
-            OutlookEvent.from_appointment(app) for app in restricted_calendar
+            OutlookEvent.from_properties(properties)
+            for properties in restricted_calendar
         ]
 
         s = "s" if len(events) != 1 else ""
@@ -21,7 +21,7 @@ from daily_tracker.integrations.calendars.calendars import (
 )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class OutlookEvent(CalendarEvent):
     """
     An Outlook event corresponding to Windows.
@@ -35,7 +35,7 @@ class OutlookEvent(CalendarEvent):
         :param appointment: The win32com appointment to generate the event from.
         """
 
-        return OutlookEvent(
+        return cls(
             subject=appointment.subject,
             start=appointment.start,
             end=appointment.end,
@@ -78,6 +78,32 @@ class Outlook(Calendar, core.Input):
                 [
                     f"[Start] >= '{start_datetime.strftime('%Y-%m-%d %H:%M')}'",
                     f"[END] < '{end_datetime.strftime('%Y-%m-%d %H:%M')}'",
+                    # These are filtered out anyway, so leave them in Outlook
+                    "[AllDayEvent] = False",
+                ]
+            )
+        )
+
+        return [
+            OutlookEvent.from_appointment(app) for app in restricted_calendar
+        ]
+
+    def get_appointments_overlapping_datetimes(
+        self,
+        start_datetime: datetime.datetime,
+        end_datetime: datetime.datetime,
+    ) -> list[OutlookEvent]:
+        """
+        Return the events in the calendar that overlap the start datetime
+        (inclusive) and end datetime (exclusive).
+        """
+
+        restricted_calendar = self.calendar.Restrict(
+            " AND ".join(
+                [
+                    f"[Start] < '{end_datetime.strftime('%Y-%m-%d %H:%M')}'",
+                    f"[END] > '{start_datetime.strftime('%Y-%m-%d %H:%M')}'",
+                    "[AllDayEvent] = False",
                 ]
             )
         )
@@ -101,6 +127,7 @@ class Outlook(Calendar, core.Input):
                 [
                     f"[Start] <= '{datetime_string}'",
                     f"[END] > '{datetime_string}'",
+                    "[AllDayEvent] = False",
                 ]
             )
         )
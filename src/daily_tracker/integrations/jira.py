@@ -15,25 +15,175 @@ TODO: This should be updated to pick up the API implementation from the Jira
     * https://jira.atlassian.com/browse/JRASERVER-68539
 """
 
+from __future__ import annotations
+
+import atexit
 import base64
+import concurrent.futures
+import dataclasses
 import datetime
+import functools
 import http
-import json
+import itertools
 import logging
+import operator
 import os
+import queue
 import re
+import threading
+from collections.abc import Iterable
 
+import cachetools
 import requests
 
-from daily_tracker import core
+from daily_tracker import core, utils
+from daily_tracker.integrations import _http
 
 logger = logging.getLogger("integrations")
 
-JIRA_CREDENTIALS = {
-    "domain": os.getenv("JIRA_DOMAIN"),
-    "key": os.getenv("JIRA_KEY"),
-    "secret": os.getenv("JIRA_SECRET"),
-}
+# Reads are spaced out less than writes since they're cheaper for Jira
+READ_RATE_LIMIT = {"rate": 4, "burst": 5}
+WRITE_RATE_LIMIT = {"rate": 1, "burst": 5}
+READ_TIMEOUT_SECONDS = 0.25
+MAX_PAGES = 5
+PAGE_SIZE = 100  # The most that Jira will return in one page
+# Sprints change over hours rather than minutes, so the tickets can be reused
+# across a few pop-ups
+TICKETS_CACHE_TTL_SECONDS = 5 * 60
+PROJECT_KEY_PATTERN = re.compile(r"^[A-Z]\w{1,9}-\d+")
+# How long the queued work logs get to be posted when the process exits
+WORKLOG_SHUTDOWN_TIMEOUT_SECONDS = 10
+
+# Once the first page says how many tickets there are, the other pages can
+# be requested at the same time
+_page_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=MAX_PAGES - 1,
+    thread_name_prefix="jira-pages",
+)
+
+# The work logs from every Jira handler are posted by one background thread
+# so that the pop-up doesn't wait for Jira. ``None`` stops the thread
+_worklogs: queue.Queue[tuple[Jira, Worklog] | None] = queue.Queue()
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class JiraCredentials:
+    """
+    The credentials for the Jira REST API.
+    """
+
+    domain: str | None
+    key: str | None
+    secret: str | None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Worklog:
+    """
+    A work log that is waiting to be posted to Jira.
+    """
+
+    issue_key: str
+    detail: str
+    at_datetime: datetime.datetime
+    interval: int
+
+
+def coalesce_worklogs(worklogs: Iterable[Worklog]) -> list[Worklog]:
+    """
+    Merge consecutive work logs for the same issue and detail into one.
+
+    The merged work log starts at the earliest time and covers the total
+    interval of the work logs that went into it.
+    """
+
+    coalesced: list[Worklog] = []
+    for worklog in worklogs:
+        previous = coalesced[-1] if coalesced else None
+        if (
+            previous is not None
+            and previous.issue_key == worklog.issue_key
+            and previous.detail == worklog.detail
+        ):
+            coalesced[-1] = dataclasses.replace(
+                previous,
+                at_datetime=min(previous.at_datetime, worklog.at_datetime),
+                interval=previous.interval + worklog.interval,
+            )
+        else:
+            coalesced.append(worklog)
+
+    return coalesced
+
+
+def _post_worklogs() -> None:
+    """
+    Post the queued work logs to Jira until ``None`` is queued.
+
+    Anything that queued up while the last work log was being posted is
+    coalesced (per handler) before it's posted.
+    """
+
+    stopped = False
+    while not stopped:
+        items = [_worklogs.get()]
+        while True:
+            try:
+                items.append(_worklogs.get_nowait())
+            except queue.Empty:
+                break
+
+        stopped = None in items
+        for handler, group in itertools.groupby(
+            (item for item in items if item is not None),
+            key=operator.itemgetter(0),
+        ):
+            for worklog in coalesce_worklogs(worklog for _, worklog in group):
+                try:
+                    handler._post_worklog(worklog)
+                except Exception as e:
+                    logger.error(f"Could not post work log: {e}")
+
+
+@functools.cache
+def _start_worklog_worker() -> None:
+    """
+    Start the thread that posts the queued work logs, once per process.
+
+    When the process exits, the thread gets a few seconds to post what's
+    already queued before it's given up on.
+    """
+
+    worker = threading.Thread(
+        target=_post_worklogs,
+        name="jira-worklogs",
+        daemon=True,
+    )
+    worker.start()
+
+    def stop_worker() -> None:
+        _worklogs.put(None)
+        worker.join(timeout=WORKLOG_SHUTDOWN_TIMEOUT_SECONDS)
+        if worker.is_alive():
+            logger.warning("Gave up waiting for the work logs to be posted")
+
+    atexit.register(stop_worker)
+
+
+@functools.cache
+def get_credentials() -> JiraCredentials:
+    """
+    Read the Jira credentials from the environment.
+
+    This is only done once per process, and the same (immutable) object is
+    shared by every caller.
+    """
+
+    return JiraCredentials(
+        domain=os.getenv("JIRA_DOMAIN"),
+        key=os.getenv("JIRA_KEY"),
+        secret=os.getenv("JIRA_SECRET"),
+    )
 
 
 class JiraConnector:
@@ -44,16 +194,36 @@ class JiraConnector:
     any layers on top of this.
     """
 
-    def __init__(self, domain: str, key: str, secret: str) -> None:
-        self._base_url = f"https://{domain}.atlassian.net/rest/api/3/"
-        self._api_key = key
-        self._api_secret = secret
+    def __init__(self, credentials: JiraCredentials) -> None:
+        self._base_url = (
+            f"https://{credentials.domain}.atlassian.net/rest/api/3/"
+        )
+        self._api_key = credentials.key
+        self._api_secret = credentials.secret
+        self._session = _http.create_session()
+        # The credentials don't change, so the headers only need setting once
+        self._session.headers.update(self.request_headers)
 
-    @property
+    def __enter__(self) -> JiraConnector:
+        return self
+
+    def __exit__(self, *args) -> None:  # noqa: ANN002
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the connections to Jira.
+        """
+
+        self._session.close()
+
+    @functools.cached_property
     def auth_basic(self) -> str:
         """
         Encode the key and secret using Basic Authentication.
 
+        The credentials don't change, so this is only encoded once.
+
         See more at the Atlassian documentation:
             https://developer.atlassian.com/cloud/jira/platform/basic-auth-for-rest-apis/#supply-basic-auth-headers
         """
@@ -65,7 +235,7 @@ class JiraConnector:
             ).decode()
         )
 
-    @property
+    @functools.cached_property
     def request_headers(self) -> dict:
         """
         Expose the default headers in a dictionary.
@@ -88,10 +258,9 @@ class JiraConnector:
         """
 
         endpoint = "project/search"
-        return requests.request(  # noqa: S113
+        return self._session.request(
             method="GET",
             url=self._base_url + endpoint,
-            headers=self.request_headers,
             params={"maxResults": max_results},
         )
 
@@ -103,10 +272,9 @@ class JiraConnector:
         """
 
         endpoint = f"issue/{issue_key}"
-        return requests.request(  # noqa: S113
+        return self._session.request(
             method="GET",
             url=self._base_url + endpoint,
-            headers=self.request_headers,
             data={},
         )
 
@@ -126,14 +294,13 @@ class JiraConnector:
         endpoint = "search"
         params = {
             "jql": jql,
-            "fields": fields,
+            "fields": ",".join(fields),
             "startAt": start_at,
             "maxResults": max_results,
         }
-        return requests.request(  # noqa: S113
+        return self._session.request(
             method="GET",
             url=self._base_url + endpoint,
-            headers=self.request_headers,
             params=params,
         )
 
@@ -145,10 +312,9 @@ class JiraConnector:
         """
 
         endpoint = f"project/{project_id}/components"
-        return requests.request(  # noqa: S113
+        return self._session.request(
             method="GET",
             url=self._base_url + endpoint,
-            headers=self.request_headers,
             data={},
         )
 
@@ -160,10 +326,9 @@ class JiraConnector:
         """
 
         endpoint = "role"
-        return requests.request(  # noqa: S113
+        return self._session.request(
             method="GET",
             url=self._base_url + endpoint,
-            headers=self.request_headers,
             data={},
         )
 
@@ -191,38 +356,35 @@ class JiraConnector:
         """
 
         endpoint = f"issue/{issue_key}/worklog"
-        payload = json.dumps(
-            {
-                "timeSpentSeconds": interval * 60,
-                "comment": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [
-                                {
-                                    "text": detail,
-                                    "type": "text",
-                                }
-                            ],
-                        }
-                    ],
-                },
-                # TODO: Make this timezone-aware
-                "started": f"{at_datetime.strftime('%Y-%m-%dT%H:%M:%S')}.000+0000",
-            }
-        )
+        payload = {
+            "timeSpentSeconds": interval * 60,
+            "comment": {
+                "type": "doc",
+                "version": 1,
+                "content": [
+                    {
+                        "type": "paragraph",
+                        "content": [
+                            {
+                                "text": detail,
+                                "type": "text",
+                            }
+                        ],
+                    }
+                ],
+            },
+            # TODO: Make this timezone-aware
+            "started": f"{at_datetime.strftime('%Y-%m-%dT%H:%M:%S')}.000+0000",
+        }
 
         try:
-            return requests.request(  # noqa: S113
+            return self._session.request(
                 method="POST",
                 url=self._base_url + endpoint,
-                headers=self.request_headers,
-                data=payload,
+                json=payload,
             )
-        except Exception as e:
-            logger.debug(f"Could not add worklog: {e}")
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Could not add worklog: {e}")
 
     def create_issue(
         self,
@@ -237,38 +399,35 @@ class JiraConnector:
         """
 
         endpoint = "issue"
-        payload = json.dumps(
-            {
-                "update": {},
-                "fields": {
-                    "summary": summary,
-                    "issuetype": {"id": "10001"},  # Task
-                    "project": {"id": project_id},
-                    "description": {
-                        "type": "doc",
-                        "version": 1,
-                        "content": [
-                            {
-                                "type": "paragraph",
-                                "content": [
-                                    {
-                                        "text": description,
-                                        "type": "text",
-                                    }
-                                ],
-                            }
-                        ],
-                    },
-                    "labels": [],
-                    "duedate": None,
+        payload = {
+            "update": {},
+            "fields": {
+                "summary": summary,
+                "issuetype": {"id": "10001"},  # Task
+                "project": {"id": project_id},
+                "description": {
+                    "type": "doc",
+                    "version": 1,
+                    "content": [
+                        {
+                            "type": "paragraph",
+                            "content": [
+                                {
+                                    "text": description,
+                                    "type": "text",
+                                }
+                            ],
+                        }
+                    ],
                 },
-            }
-        )
-        return requests.request(  # noqa: S113
+                "labels": [],
+                "duedate": None,
+            },
+        }
+        return self._session.request(
             method="POST",
             url=self._base_url + endpoint,
-            headers=self.request_headers,
-            data=payload,
+            json=payload,
         )
 
 
@@ -285,10 +444,19 @@ class Jira(core.Input, core.Output):
         configuration: core.Configuration,
         debug_mode: bool = False,
     ) -> None:
-        self.connector = JiraConnector(**JIRA_CREDENTIALS)
-        self.project_key_pattern = re.compile(r"^[A-Z]\w{1,9}-\d+")
+        self.connector = JiraConnector(credentials=get_credentials())
         self.configuration = configuration
         self.debug_mode = debug_mode
+        self._read_limiter = utils.RateLimiter(**READ_RATE_LIMIT)
+        self._write_limiter = utils.RateLimiter(**WRITE_RATE_LIMIT)
+        self._last_tickets_in_sprint: list[str] = []
+        self._tickets_in_sprint_cache = cachetools.TTLCache(
+            maxsize=8,
+            ttl=TICKETS_CACHE_TTL_SECONDS,
+        )
+        # The cache is cleared from the work log thread
+        self._tickets_in_sprint_lock = threading.Lock()
+        _start_worklog_worker()
 
     def debug(self) -> tuple[int, str]:
         return 1, "Jira connection debugger not implemented yet"
@@ -309,49 +477,116 @@ class Jira(core.Input, core.Output):
     def get_tickets_in_sprint(self) -> list[str]:
         """
         Get the list of tickets in the active sprint for the current user.
+
+        If the Jira calls are being rate limited, the last list of tickets
+        that was retrieved is returned instead of waiting.
+
+        The first page is requested on its own to get the total number of
+        tickets, and then the remaining pages are requested concurrently. If
+        some of the remaining pages are rate limited or fail, the tickets
+        from the other pages are still returned, but aren't cached.
+
+        The tickets are cached for a few minutes per Jira filter (see
+        ``invalidate``).
         """
 
+        jira_filter = self.configuration.jira_filter
+        with self._tickets_in_sprint_lock:
+            cached = self._tickets_in_sprint_cache.get(jira_filter)
+        if cached is not None:
+            return cached
+
         def get_batch_of_tickets(start_at: int) -> dict:
             """
             Inner function to loop over until all tickets have been retrieved.
+
+            Transient failures are already retried by the session, so any
+            exception that makes it out of here is worth giving up on.
+            """
+
+            return self.connector.search_for_issues_using_jql(
+                jql=jira_filter,
+                # The key is always returned, and it's only the key and
+                # summary that make it into the drop-down
+                fields=["summary"],
+                start_at=start_at,
+                max_results=PAGE_SIZE,
+            ).json()
+
+        def get_tickets(response: dict) -> list[str]:
+            """
+            Return the tickets in a page, or raise an error if Jira returned
+            one instead.
             """
 
-            try:
-                return json.loads(
-                    self.connector.search_for_issues_using_jql(
-                        jql=self.configuration.jira_filter,
-                        fields=["summary", "duedate", "assignee"],
-                        start_at=start_at,
-                    ).text
-                )
-            except (
-                requests.exceptions.JSONDecodeError,  # Usually because Jira is down
-                requests.exceptions.ProxyError,  # Sometimes pops up behind a proxy
-            ):
-                return {"total": 1_000, "issues": []}
-
-        results = []
-        total = 999
-        retries = 0
-        max_retries = 5
-        while len(results) < total and retries < max_retries:
-            response = get_batch_of_tickets(start_at=len(results))
             if "errorMessages" in response:
-                error_message = " ".join(response["errorMessages"])
-                logger.warning(
-                    f"Could not get tickets in sprint: {error_message}"
-                )
-                return []
+                raise ValueError(" ".join(response["errorMessages"]))
 
-            total = response["total"]
-            results += [
+            return [
                 f"{issue['key']} {issue['fields']['summary']}"
                 for issue in response["issues"]
             ]
-            retries += 1
 
+        if not self._read_limiter.acquire(timeout=READ_TIMEOUT_SECONDS):
+            logger.debug("Rate limited, using the last tickets in sprint")
+            return self._last_tickets_in_sprint
+
+        try:
+            first_page = get_batch_of_tickets(start_at=0)
+        # Includes the JSON decode errors (usually because Jira is down) and
+        # proxy errors
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Could not get tickets in sprint: {e}")
+            return self._last_tickets_in_sprint
+
+        try:
+            results = get_tickets(first_page)
+        except ValueError as e:
+            logger.warning(f"Could not get tickets in sprint: {e}")
+            return []
+
+        # An empty first page means there's nothing to fetch, so there's no
+        # point asking for more
+        complete = True
+        pages = []
+        if page_size := len(results):
+            for start_at in range(
+                page_size,
+                min(first_page["total"], MAX_PAGES * page_size),
+                page_size,
+            ):
+                if not self._read_limiter.acquire(timeout=READ_TIMEOUT_SECONDS):
+                    logger.debug("Rate limited, skipping the remaining pages")
+                    complete = False
+                    break
+                pages.append(
+                    _page_executor.submit(get_batch_of_tickets, start_at)
+                )
+
+        for page in pages:
+            try:
+                results.extend(get_tickets(page.result()))
+            except (requests.exceptions.RequestException, ValueError) as e:
+                logger.warning(f"Could not get a page of tickets: {e}")
+                complete = False
+
+        if complete:
+            self._last_tickets_in_sprint = results
+            with self._tickets_in_sprint_lock:
+                self._tickets_in_sprint_cache[jira_filter] = results
         return results
 
+    def invalidate(self) -> None:
+        """
+        Clear the cached tickets so that the next call goes to Jira.
+
+        This is called after a work log is posted, so that the next pop-up
+        sees the ticket as it is now.
+        """
+
+        with self._tickets_in_sprint_lock:
+            self._tickets_in_sprint_cache.clear()
+
     def post_event(self, entry: core.Entry) -> None:
         """
         The actions to perform after the event.
@@ -377,24 +612,48 @@ class Jira(core.Input, core.Output):
         interval: int,
     ) -> None:
         """
-        Post the task, detail, and time to the corresponding ticket's worklog.
+        Queue the task, detail, and time to be posted to the corresponding
+        ticket's worklog.
         """
 
-        logger.debug("Posting log to Jira...")
-        issue_key = re.search(self.project_key_pattern, task)
+        issue_key = PROJECT_KEY_PATTERN.match(task)
         if issue_key is None:
-            logger.debug(f"Could not find {self.project_key_pattern} in {task}")
+            logger.debug(f"Could not find {PROJECT_KEY_PATTERN} in {task}")
             return
 
-        logger.debug(f"Posting work log to {issue_key[0]}")
+        logger.debug(f"Queueing work log for {issue_key[0]}")
+        _worklogs.put(
+            (
+                self,
+                Worklog(
+                    issue_key=issue_key[0],
+                    detail=detail,
+                    at_datetime=at_datetime,
+                    interval=interval,
+                ),
+            )
+        )
+
+    def _post_worklog(self, worklog: Worklog) -> None:
+        """
+        Post a work log to its ticket.
+
+        This runs on the work log thread, so it waits for the rate limit
+        rather than dropping the work log.
+        """
+
+        self._write_limiter.acquire()
+        logger.debug(f"Posting work log to {worklog.issue_key}")
         response = self.connector.add_worklog(
-            issue_key=issue_key[0],
-            detail=detail,
-            at_datetime=at_datetime,
-            interval=interval,
+            issue_key=worklog.issue_key,
+            detail=worklog.detail,
+            at_datetime=worklog.at_datetime,
+            interval=worklog.interval,
         )
         if response is None:
             logger.debug("Could not post work log, see above")
         elif response.status_code != http.HTTPStatus.CREATED:
             logger.debug(f"Response code: {response.status_code}")
             logger.debug(f"Could not post work log: {response.text}")
+        else:
+            self.invalidate()
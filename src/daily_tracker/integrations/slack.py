@@ -8,20 +8,42 @@ You can generate a webhook URL by navigating to the channel you want to
 post to and configuring the "Incoming Webhooks" app.
 """
 
+from __future__ import annotations
+
+import dataclasses
+import functools
 import http
-import json
 import logging
 import os
 
-import requests
-
-from daily_tracker import core
+from daily_tracker import core, utils
+from daily_tracker.integrations import _http
 
 logger = logging.getLogger("integrations")
 
-SLACK_CREDENTIALS = {
-    "webhook_url": os.getenv("SLACK_WEBHOOK_URL"),
-}
+# Slack allows about one message per second on an incoming webhook
+WRITE_RATE_LIMIT = {"rate": 1, "burst": 3}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class SlackCredentials:
+    """
+    The credentials for the Slack Incoming Webhooks app.
+    """
+
+    webhook_url: str | None
+
+
+@functools.cache
+def get_credentials() -> SlackCredentials:
+    """
+    Read the Slack credentials from the environment.
+
+    This is only done once per process, and the same (immutable) object is
+    shared by every caller.
+    """
+
+    return SlackCredentials(webhook_url=os.getenv("SLACK_WEBHOOK_URL"))
 
 
 class SlackConnector:
@@ -31,8 +53,24 @@ class SlackConnector:
 
     webhook_url: str
 
-    def __init__(self, webhook_url: str) -> None:
-        self.webhook_url = webhook_url
+    def __init__(self, credentials: SlackCredentials) -> None:
+        self.webhook_url = credentials.webhook_url
+        # A repeated message is better than a lost one when Slack is rate
+        # limiting us
+        self._session = _http.create_session(retry_posts=True)
+
+    def __enter__(self) -> SlackConnector:
+        return self
+
+    def __exit__(self, *args) -> None:  # noqa: ANN002
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the connections to Slack.
+        """
+
+        self._session.close()
 
     def post_message(self, message: str) -> None:
         """
@@ -47,7 +85,10 @@ class SlackConnector:
             "username": "Daily Tracker",
             "icon_emoji": ":clock10:",
         }
-        response = requests.post(url=self.webhook_url, data=json.dumps(payload))  # noqa: S113
+        response = self._session.post(
+            url=self.webhook_url,
+            json=payload,
+        )
         if response.status_code != http.HTTPStatus.OK:
             raise RuntimeError(
                 f"{response.status_code}: Failed to post message to Slack\n\n{response.text}"
@@ -63,8 +104,9 @@ class Slack(core.Output):
     """
 
     def __init__(self, configuration: core.Configuration = None) -> None:
-        self.connector = SlackConnector(**SLACK_CREDENTIALS)
+        self.connector = SlackConnector(credentials=get_credentials())
         self.configuration = configuration
+        self._write_limiter = utils.RateLimiter(**WRITE_RATE_LIMIT)
 
     def debug(self) -> tuple[int, str]:
         return 1, "Slack connection debugger not implemented yet"
@@ -84,17 +126,17 @@ class Slack(core.Output):
         Post the task details to a channel.
 
         The message accepts Markdown, so the task will be put in bold.
+
+        This runs on the post-event threads, so it waits for the rate limit
+        rather than dropping the message.
         """
 
+        self._write_limiter.acquire()
         self.connector.post_message(f"*{task}*: {detail}")
 
 
 if __name__ == "__main__":
-    import os
-
-    if slack_connector := SlackConnector(
-        webhook_url=os.getenv("SLACK_WEBHOOK_URL")
-    ):
+    with SlackConnector(credentials=get_credentials()) as slack_connector:
         slack_connector.post_message(
             "This is a *test* success message with a link: <https://www.google.com|Google>"
         )
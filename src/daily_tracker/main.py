@@ -8,7 +8,6 @@ import logging
 import logging.config
 
 import yaml
-from wakepy import keep
 
 from daily_tracker import _actions, core, integrations, utils
 from daily_tracker.core import apis, database, scheduler
@@ -28,7 +27,9 @@ def configure_integrations(config: core.configuration.Configuration) -> None:
     database.Database(utils.DB, config)
     integrations.calendars.get_linked_calendar(config)
     integrations.github.GitHub(config)
-    integrations.jira.Jira(config)
+    # Jira is only worth connecting to when it's going to be used
+    if config.jira_filter or config.post_to_jira:
+        integrations.jira.Jira(config)
     integrations.slack.Slack(config)
     integrations.monday.Monday(config)
 
@@ -41,6 +42,19 @@ def create_form(at_datetime: datetime.datetime) -> None:
     _actions.ActionHandler(at_datetime)
 
 
+def prefetch_appointments(at_datetime: datetime.datetime) -> None:
+    """
+    Fetch the calendar events ahead of the pop-up.
+
+    This runs on the scheduler's thread, which is also the thread that the
+    calendar was created on (Outlook on Windows needs that).
+    """
+
+    for handler in apis.Input.apis.values():
+        if isinstance(handler, integrations.Calendar):
+            handler.prefetch(at_datetime)
+
+
 def main(debug_mode: bool = False) -> None:
     """
     Entry point into this project.
@@ -57,7 +71,10 @@ def main(debug_mode: bool = False) -> None:
 
     config = core.Configuration.from_default()
     configure_integrations(config)
-    indefinite_scheduler = scheduler.IndefiniteScheduler(create_form)
+    indefinite_scheduler = scheduler.IndefiniteScheduler(
+        action=create_form,
+        prepare=prefetch_appointments,
+    )
 
     if not APPLICATION_CREATED:
         # create.create_env()
@@ -72,6 +89,9 @@ def main(debug_mode: bool = False) -> None:
         return
 
     if config.keep_awake:
+        # Only pay for importing wakepy when it's actually used
+        from wakepy import keep  # noqa: PLC0415
+
         with keep.presenting():
             indefinite_scheduler.schedule_first()
     else:
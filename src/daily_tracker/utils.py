@@ -2,13 +2,17 @@
 Utilities to use throughout the modules.
 """
 
+import functools
 import pathlib
+import threading
+import time
 
 DAILY_TRACKER = pathlib.Path(__file__).parent  # `src/daily_tracker/`
 ROOT = DAILY_TRACKER.parent.parent
 DB = DAILY_TRACKER / "tracker.db"
 
 
+@functools.lru_cache(maxsize=64)
 def pascal_to_snake(text: str) -> str:
     """
     Convert a pascal-case string to a snake-case string.
@@ -28,6 +32,9 @@ def pascal_to_snake(text: str) -> str:
          with no separator between words, such as "PascalCase".
 
     :return: The snake-case version of the input string.
+
+    This is only called with a handful of class names, so the results are
+    cached.
     """
 
     return "".join(
@@ -56,3 +63,63 @@ def get_first_item_in_dict(dictionary: dict) -> tuple:
     """
 
     return next(iter(dictionary.items()))
+
+
+class RateLimiter:
+    """
+    A token bucket rate limiter.
+
+    The bucket holds up to ``burst`` tokens and refills at ``rate`` tokens
+    per second; each call that goes through takes a token.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """
+        :param rate: The number of calls per second to allow on average.
+        :param burst: The number of calls that can be made back-to-back
+            before the rate limit kicks in.
+        """
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _try_acquire(self) -> float:
+        """
+        Take a token if one is available and return 0, otherwise return the
+        number of seconds until the next token is available.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._updated_at) * self.rate,
+            )
+            self._updated_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """
+        Wait for a token and return whether one was taken.
+
+        :param timeout: The maximum number of seconds to wait for a token.
+            Waits indefinitely when ``None``.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while wait := self._try_acquire():
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+        return True
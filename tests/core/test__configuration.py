@@ -0,0 +1,19 @@
+"""
+Unit tests for the ``daily_tracker.core.configuration`` module.
+"""
+
+from daily_tracker.core import configuration
+
+
+def test__configuration__from_default():
+    """
+    The default configuration is only read again after it's invalidated.
+    """
+
+    config = configuration.Configuration.from_default()
+
+    assert configuration.Configuration.from_default() is config
+
+    configuration.Configuration.invalidate()
+
+    assert configuration.Configuration.from_default() is not config
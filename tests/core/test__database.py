@@ -2,6 +2,9 @@
 Unit tests for the ``daily_tracker.core.database`` module.
 """
 
+import datetime
+import textwrap
+
 import pytest
 
 from daily_tracker import utils
@@ -20,3 +23,105 @@ def test__get_recent_tasks():
     )
 
     print(database_handler.get_recent_tasks(show_last_n_weeks=2))
+
+
+def test__import_history(tmp_path):
+    """
+    The CSV history replaces the existing tracker history.
+    """
+
+    history = tmp_path / "tracker.csv"
+    history.write_text(
+        textwrap.dedent(
+            """\
+            date_time,task,detail,interval
+            2024-01-01 09:00:00,Meetings,Stand-up,15
+            2024-01-01T09:15:00,Adhoc Task,,15
+            """
+        )
+    )
+    database_handler = database.Database(
+        database_filepath=str(tmp_path / "tracker.db"),
+        configuration=configuration.Configuration.from_default(),
+    )
+    database_handler.write_to_database(
+        task="Old Task",
+        detail="",
+        at_datetime=datetime.datetime(2023, 1, 1, 9),
+        interval=15,
+    )
+
+    database_handler.import_history(filepath=str(history))
+
+    assert database_handler.connection.connection.execute(
+        "select * from tracker order by date_time"
+    ).fetchall() == [
+        ("2024-01-01 09:00:00", "Meetings", "Stand-up", 15),
+        ("2024-01-01 09:15:00", "Adhoc Task", "", 15),
+    ]
+    assert database_handler.get_details_for_task("Meetings") == ["Stand-up"]
+
+
+def test__get_details_for_tasks(tmp_path):
+    """
+    The recent details are returned for each task, most recent first.
+    """
+
+    database_handler = database.Database(
+        database_filepath=str(tmp_path / "tracker.db"),
+        configuration=configuration.Configuration.from_default(),
+    )
+    for minute, (task, detail) in enumerate(
+        [
+            ("Meetings", "Stand-up"),
+            ("Meetings", "Retro"),
+            ("Adhoc Task", "Emails"),
+            ("Meetings", "Stand-up"),
+        ]
+    ):
+        database_handler.write_to_database(
+            task=task,
+            detail=detail,
+            at_datetime=datetime.datetime(2024, 1, 1, 9, minute),
+            interval=15,
+        )
+
+    assert database_handler.get_details_for_tasks(
+        ["Meetings", "Adhoc Task", "Lunch Break"]
+    ) == {
+        "Meetings": ["Stand-up", "Retro"],
+        "Adhoc Task": ["Emails"],
+        "Lunch Break": [],
+    }
+
+
+def test__get_recent_tasks__cache(tmp_path):
+    """
+    The cached recent tasks are refreshed when an entry is written.
+    """
+
+    database_handler = database.Database(
+        database_filepath=str(tmp_path / "tracker.db"),
+        configuration=configuration.Configuration.from_default(),
+    )
+    now = datetime.datetime.now().replace(microsecond=0)
+    database_handler.write_to_database(
+        task="Old Task",
+        detail="Old detail",
+        at_datetime=now - datetime.timedelta(minutes=15),
+        interval=15,
+    )
+    recent_tasks = database_handler.get_recent_tasks(show_last_n_weeks=2)
+
+    database_handler.write_to_database(
+        task="New Task",
+        detail="New detail",
+        at_datetime=now,
+        interval=15,
+    )
+
+    assert "New Task" not in recent_tasks
+    assert database_handler.get_recent_tasks(show_last_n_weeks=2) == {
+        **recent_tasks,
+        "New Task": "New detail",
+    }
@@ -35,3 +35,52 @@ def test__get_next_interval(
         from_time=from_time,
         interval_in_minutes=interval_in_minutes,
     )
+
+
+def test__indefinite_scheduler(monkeypatch):
+    """
+    Events that are due are run until the scheduler is cancelled.
+    """
+
+    monkeypatch.setattr(
+        scheduler, "_get_interval_from_configuration", lambda: 15
+    )
+    calls = []
+
+    def action(at_datetime: datetime.datetime) -> None:
+        calls.append(at_datetime)
+        if len(calls) == 2:
+            indefinite_scheduler._cancel_next()
+
+    indefinite_scheduler = scheduler.IndefiniteScheduler(action)
+    indefinite_scheduler.schedule_first(schedule_at=iso("2020-01-01 00:01:00"))
+
+    assert calls == [iso("2020-01-01 00:15:00"), iso("2020-01-01 00:30:00")]
+
+
+def test__indefinite_scheduler__prepare(monkeypatch):
+    """
+    The preparation is run before each event, and doesn't stop the event
+    when it fails.
+    """
+
+    monkeypatch.setattr(
+        scheduler, "_get_interval_from_configuration", lambda: 15
+    )
+    calls = []
+
+    def prepare(at_datetime: datetime.datetime) -> None:
+        calls.append(("prepare", at_datetime))
+        raise RuntimeError("Calendar is down")
+
+    def action(at_datetime: datetime.datetime) -> None:
+        calls.append(("action", at_datetime))
+        indefinite_scheduler._cancel_next()
+
+    indefinite_scheduler = scheduler.IndefiniteScheduler(action, prepare)
+    indefinite_scheduler.schedule_first(schedule_at=iso("2020-01-01 00:01:00"))
+
+    assert calls == [
+        ("prepare", iso("2020-01-01 00:15:00")),
+        ("action", iso("2020-01-01 00:15:00")),
+    ]
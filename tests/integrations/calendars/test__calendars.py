@@ -0,0 +1,139 @@
+"""
+Unit tests for the ``daily_tracker.integrations.calendars.calendars`` module.
+"""
+
+import datetime
+
+from daily_tracker import core
+from daily_tracker.integrations.calendars import calendars
+
+
+def _event(
+    subject: str,
+    start: str,
+    end: str,
+    categories: set[str] | None = None,
+) -> calendars.CalendarEvent:
+    return calendars.CalendarEvent(
+        subject=subject,
+        start=datetime.datetime.fromisoformat(start),
+        end=datetime.datetime.fromisoformat(end),
+        categories=categories or set(),
+        all_day_event=False,
+        response=calendars.EventResponse.ACCEPTED,
+    )
+
+
+def test__appointment_index():
+    """
+    The events on or over the datetime are returned, including long events
+    that started before shorter ones.
+    """
+
+    index = calendars.AppointmentIndex(
+        [
+            _event("Stand-up", "2024-01-01 09:00", "2024-01-01 09:15"),
+            _event("Workshop", "2024-01-01 08:00", "2024-01-01 12:00"),
+            _event("Lunch", "2024-01-01 12:00", "2024-01-01 13:00"),
+        ]
+    )
+
+    def subjects_at(at: str) -> list[str]:
+        return [
+            event.subject
+            for event in index.at(datetime.datetime.fromisoformat(at))
+        ]
+
+    assert len(index) == 3
+    assert subjects_at("2024-01-01 07:59") == []
+    assert subjects_at("2024-01-01 09:00") == ["Workshop", "Stand-up"]
+    assert subjects_at("2024-01-01 09:15") == ["Workshop"]
+    assert subjects_at("2024-01-01 12:00") == ["Lunch"]
+    assert subjects_at("2024-01-01 13:00") == []
+
+
+def test__filter_appointments():
+    """
+    Events with any of the excluded categories are filtered out.
+    """
+
+    events = [
+        _event("Stand-up", "2024-01-01 09:00", "2024-01-01 09:15", {"Daily"}),
+        _event("Review", "2024-01-01 09:00", "2024-01-01 10:00", {"Work"}),
+        _event("Focus", "2024-01-01 09:00", "2024-01-01 11:00"),
+    ]
+
+    actual = calendars._filter_appointments(
+        at_datetime=datetime.datetime(2024, 1, 1, 9),
+        events=events,
+        categories_to_exclude=["Daily", "Holiday"],
+    )
+
+    assert [event.subject for event in actual] == ["Review", "Focus"]
+
+
+class _FakeCalendar(calendars.Calendar):
+    """
+    A calendar that serves a fixed list of events.
+    """
+
+    def __init__(self, events: list[calendars.CalendarEvent]) -> None:
+        super().__init__(
+            configuration=core.Configuration({"tracker": {"options": {}}})
+        )
+        self.events = events
+
+    def get_appointments_between_datetimes(
+        self,
+        start_datetime: datetime.datetime,
+        end_datetime: datetime.datetime,
+    ) -> list[calendars.CalendarEvent]:
+        return [
+            event
+            for event in self.events
+            if start_datetime <= event.start and event.end < end_datetime
+        ]
+
+    def get_appointments_overlapping_datetimes(
+        self,
+        start_datetime: datetime.datetime,
+        end_datetime: datetime.datetime,
+    ) -> list[calendars.CalendarEvent]:
+        return [
+            event
+            for event in self.events
+            if event.start < end_datetime and start_datetime < event.end
+        ]
+
+    def get_appointments_at_datetime(
+        self,
+        at_datetime: datetime.datetime,
+    ) -> list[calendars.CalendarEvent]:
+        return self.get_appointments_overlapping_datetimes(
+            start_datetime=at_datetime,
+            end_datetime=at_datetime + datetime.timedelta(seconds=1),
+        )
+
+
+def test__calendar__on_event__over_midnight():
+    """
+    A meeting that runs over midnight is found on both days.
+    """
+
+    calendar = _FakeCalendar(
+        [
+            _event("Release", "2024-01-01 23:00", "2024-01-02 00:30"),
+            _event("Late call", "2024-01-01 23:30", "2024-01-02 00:00"),
+        ]
+    )
+
+    def details_at(at: str) -> list[str]:
+        return [
+            detail
+            for task in calendar.on_event(datetime.datetime.fromisoformat(at))
+            for detail in task.details
+        ]
+
+    assert details_at("2024-01-01 23:45") == ["Release", "Late call"]
+    assert details_at("2024-01-02 00:00") == ["Release"]
+    assert details_at("2024-01-02 00:30") == []
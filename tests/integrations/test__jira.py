@@ -0,0 +1,260 @@
+"""
+Unit tests for the ``daily_tracker.integrations.jira`` module.
+"""
+
+import datetime
+import queue
+
+import pytest
+import requests
+
+from daily_tracker import core, utils
+from daily_tracker.integrations import jira
+
+
+def _worklog(issue_key: str, detail: str, at: str) -> jira.Worklog:
+    return jira.Worklog(
+        issue_key=issue_key,
+        detail=detail,
+        at_datetime=datetime.datetime.fromisoformat(at),
+        interval=15,
+    )
+
+
+class _FakeResponse:
+    def __init__(self, content: dict, status_code: int = 200) -> None:
+        self.content = content
+        self.status_code = status_code
+
+    def json(self) -> dict:
+        return self.content
+
+
+class _FakeConnector:
+    """
+    Serves the pages of the tickets, and records the searches and the work
+    logs that it's asked to add.
+    """
+
+    def __init__(self, tickets: int = 0, failing: int | None = None) -> None:
+        self.tickets = [f"ABC-{i}" for i in range(1, tickets + 1)]
+        self.failing = failing
+        self.searches: list[int] = []
+        self.worklogs: list[str] = []
+
+    def search_for_issues_using_jql(
+        self,
+        start_at: int,
+        max_results: int,
+        **kwargs,  # noqa: ANN003
+    ) -> _FakeResponse:
+        self.searches.append(start_at)
+        if start_at == self.failing:
+            raise requests.exceptions.ConnectionError("Jira is down")
+
+        return _FakeResponse(
+            {
+                "total": len(self.tickets),
+                "issues": [
+                    {"key": key, "fields": {"summary": "Summary"}}
+                    for key in self.tickets[start_at : start_at + max_results]
+                ],
+            }
+        )
+
+    def add_worklog(self, issue_key: str, **kwargs) -> _FakeResponse:  # noqa: ANN003
+        self.worklogs.append(issue_key)
+        return _FakeResponse({}, status_code=201)
+
+
+@pytest.fixture
+def jira_handler(monkeypatch) -> jira.Jira:
+    """
+    Return a Jira handler with a fake connector, without registering it with
+    the APIs.
+    """
+
+    monkeypatch.setattr(core.Input, "apis", {})
+    monkeypatch.setattr(core.Output, "apis", {})
+    # The tests post the work logs themselves, so there's no worker thread
+    monkeypatch.setattr(jira, "_start_worklog_worker", lambda: None)
+    handler = jira.Jira(
+        core.Configuration(
+            {"tracker": {"options": {"jira-filter": "project = ABC"}}}
+        )
+    )
+    handler.connector = _FakeConnector(tickets=3)
+
+    return handler
+
+
+def test__coalesce_worklogs():
+    """
+    Consecutive work logs for the same issue and detail are merged, but
+    the others are left alone.
+    """
+
+    worklogs = [
+        _worklog("ABC-1", "Coding", "2024-01-01 09:00"),
+        _worklog("ABC-1", "Coding", "2024-01-01 09:15"),
+        _worklog("ABC-1", "Testing", "2024-01-01 09:30"),
+        _worklog("ABC-2", "Testing", "2024-01-01 09:45"),
+        _worklog("ABC-1", "Testing", "2024-01-01 10:00"),
+    ]
+
+    assert jira.coalesce_worklogs(worklogs) == [
+        jira.Worklog(
+            issue_key="ABC-1",
+            detail="Coding",
+            at_datetime=datetime.datetime(2024, 1, 1, 9, 0),
+            interval=30,
+        ),
+        worklogs[2],
+        worklogs[3],
+        worklogs[4],
+    ]
+
+
+class _FakeJira:
+    """
+    Records the work logs that it's asked to post.
+    """
+
+    def __init__(self) -> None:
+        self.posted: list[jira.Worklog] = []
+
+    def _post_worklog(self, worklog: jira.Worklog) -> None:
+        self.posted.append(worklog)
+
+
+def test__post_worklogs(monkeypatch):
+    """
+    The queued work logs are coalesced per handler and posted until the
+    queue is stopped.
+    """
+
+    monkeypatch.setattr(jira, "_worklogs", queue.Queue())
+    first, second = _FakeJira(), _FakeJira()
+    worklogs = [
+        _worklog("ABC-1", "Coding", "2024-01-01 09:00"),
+        _worklog("ABC-1", "Coding", "2024-01-01 09:15"),
+        _worklog("ABC-1", "Coding", "2024-01-01 09:30"),
+    ]
+    jira._worklogs.put((first, worklogs[0]))
+    jira._worklogs.put((first, worklogs[1]))
+    jira._worklogs.put((second, worklogs[2]))
+    jira._worklogs.put(None)
+
+    jira._post_worklogs()
+
+    assert first.posted == [
+        jira.Worklog(
+            issue_key="ABC-1",
+            detail="Coding",
+            at_datetime=datetime.datetime(2024, 1, 1, 9, 0),
+            interval=30,
+        )
+    ]
+    assert second.posted == [worklogs[2]]
+    assert jira._worklogs.empty()
+
+
+def test__jira__post_worklog__waits_for_rate_limit(jira_handler):
+    """
+    A rate-limited work log is posted once a token is available rather than
+    being dropped.
+    """
+
+    jira_handler._write_limiter = utils.RateLimiter(rate=20, burst=1)
+    worklog = _worklog("ABC-1", "Coding", "2024-01-01 09:00")
+
+    jira_handler._post_worklog(worklog)
+    jira_handler._post_worklog(worklog)
+
+    assert jira_handler.connector.worklogs == ["ABC-1", "ABC-1"]
+
+
+def test__jira__get_tickets_in_sprint__cached(jira_handler):
+    """
+    The tickets are cached until they're invalidated.
+    """
+
+    expected = ["ABC-1 Summary", "ABC-2 Summary", "ABC-3 Summary"]
+
+    assert jira_handler.get_tickets_in_sprint() == expected
+    assert jira_handler.get_tickets_in_sprint() == expected
+    assert jira_handler.connector.searches == [0]
+
+    jira_handler.invalidate()
+
+    assert jira_handler.get_tickets_in_sprint() == expected
+    assert jira_handler.connector.searches == [0, 0]
+
+
+def test__jira__get_tickets_in_sprint__paginated(jira_handler):
+    """
+    The pages after the first one are all requested.
+    """
+
+    jira_handler.connector = _FakeConnector(tickets=250)
+
+    tickets = jira_handler.get_tickets_in_sprint()
+
+    assert len(tickets) == 250
+    assert tickets[0] == "ABC-1 Summary"
+    assert tickets[-1] == "ABC-250 Summary"
+    assert sorted(jira_handler.connector.searches) == [0, 100, 200]
+
+
+def test__jira__get_tickets_in_sprint__page_fails(jira_handler):
+    """
+    The tickets from the other pages are returned (but not cached) when a
+    page fails.
+    """
+
+    jira_handler.connector = _FakeConnector(tickets=250, failing=100)
+
+    tickets = jira_handler.get_tickets_in_sprint()
+
+    assert len(tickets) == 150
+    assert "ABC-250 Summary" in tickets
+    assert jira_handler._tickets_in_sprint_cache == {}
+
+
+def test__jira__get_tickets_in_sprint__page_rate_limited(jira_handler):
+    """
+    The first page is returned (but not cached) when the later pages are
+    rate limited.
+    """
+
+    jira_handler.connector = _FakeConnector(tickets=250)
+    jira_handler._read_limiter = utils.RateLimiter(rate=0.01, burst=1)
+
+    tickets = jira_handler.get_tickets_in_sprint()
+
+    assert len(tickets) == 100
+    assert jira_handler.connector.searches == [0]
+    assert jira_handler._tickets_in_sprint_cache == {}
+
+
+def test__jira__get_tickets_in_sprint__first_page_fails(jira_handler):
+    """
+    The last tickets are returned when the first page fails.
+    """
+
+    jira_handler._last_tickets_in_sprint = ["ABC-1 Summary"]
+    jira_handler.connector = _FakeConnector(tickets=250, failing=0)
+
+    assert jira_handler.get_tickets_in_sprint() == ["ABC-1 Summary"]
+
+
+def test__jira__post_worklog__invalidates_tickets(jira_handler):
+    """
+    The cached tickets are cleared once a work log has been posted.
+    """
+
+    jira_handler.get_tickets_in_sprint()
+    jira_handler._post_worklog(_worklog("ABC-1", "Coding", "2024-01-01 09:00"))
+    jira_handler.get_tickets_in_sprint()
+
+    assert jira_handler.connector.searches == [0, 0]
@@ -0,0 +1,53 @@
+"""
+Unit tests for the ``daily_tracker._actions`` module.
+"""
+
+from daily_tracker import _actions, core
+
+
+class _FakeDatabase:
+    def __init__(self) -> None:
+        self.recent_tasks = {"Task": "Detail"}
+
+    def get_recent_tasks(self, show_last_n_weeks: int) -> dict[str, str]:
+        return dict(self.recent_tasks)
+
+
+class _FakeJira:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_tickets_in_sprint(self) -> list[str]:
+        self.calls += 1
+        return ["ABC-1 Summary"]
+
+
+def test__action_handler__get_dropdown_options(monkeypatch):
+    """
+    The recent tasks are read each time, while the integrations' options are
+    cached for (a little over) the pop-up interval.
+    """
+
+    monkeypatch.setattr(_actions, "_integration_options_caches", {})
+    database_handler, jira_handler = _FakeDatabase(), _FakeJira()
+    action_handler = object.__new__(_actions.ActionHandler)
+    action_handler.configuration = core.Configuration(
+        {"tracker": {"options": {"interval": 20}}}
+    )
+    action_handler.inputs = {"jira": jira_handler}
+    action_handler.outputs = {"database": database_handler}
+
+    assert action_handler.get_dropdown_options(jira_filter="ABC") == {
+        "Task": ["Detail"],
+        "ABC-1 Summary": [""],
+    }
+
+    database_handler.recent_tasks["Other task"] = "Other detail"
+
+    assert action_handler.get_dropdown_options(jira_filter="ABC") == {
+        "Task": ["Detail"],
+        "Other task": ["Other detail"],
+        "ABC-1 Summary": [""],
+    }
+    assert jira_handler.calls == 1
+    assert _actions._integration_options_caches[20].ttl == 21 * 60
@@ -2,6 +2,8 @@
 Unit tests for the ``daily_tracker.utils`` module.
 """
 
+import time
+
 from daily_tracker import utils
 
 
@@ -38,3 +40,29 @@ def test__get_first_item_in_dict():
     expected = ("a", 1)
 
     assert expected == utils.get_first_item_in_dict(dictionary)
+
+
+def test__rate_limiter__burst():
+    """
+    Test that the rate limiter allows a burst of calls and then rejects
+    calls until the bucket refills.
+    """
+
+    rate_limiter = utils.RateLimiter(rate=1, burst=3)
+
+    assert all(rate_limiter.acquire(timeout=0) for _ in range(3))
+    assert rate_limiter.acquire(timeout=0) is False
+
+
+def test__rate_limiter__waits_for_token():
+    """
+    Test that the rate limiter waits for the next token when a timeout
+    allows it.
+    """
+
+    rate_limiter = utils.RateLimiter(rate=20, burst=1)
+    rate_limiter.acquire()
+
+    start = time.monotonic()
+    assert rate_limiter.acquire(timeout=1) is True
+    assert time.monotonic() - start >= 0.04